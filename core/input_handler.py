@@ -1,16 +1,28 @@
 """
 Module 1 — Input Handler
 Accepts configuration file paths, validates existence/readability,
-computes SHA-256 hash, reads content, and returns ConfigInput objects.
+computes BLAKE2b content hash, reads content, and returns ConfigInput objects.
 """
 
 import os
+import stat
 import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from typing import Optional, Tuple, List, Dict
 from datetime import datetime
 from core.models import ConfigInput  # pyre-ignore
 
 
+# Raw read-only open flags (binary on Windows, close-on-exec where available)
+_OPEN_FLAGS = os.O_RDONLY | getattr(os, 'O_BINARY', 0) | getattr(os, 'O_CLOEXEC', 0)
+
+# Leading bytes inspected for NUL before the full UTF-8 decode
+_SNIFF_SIZE = 8192
+
+
 class InputHandler:
     """Handles file input validation, reading, and hashing."""
 
@@ -22,9 +34,17 @@ class InputHandler:
 
     MAX_FILE_SIZE = 10 * 1024 * 1024  # 10 MB limit
 
+    # Distinct paths whose loaded content is kept for reuse
+    CACHE_SIZE = 256
+
     def __init__(self, max_file_size: Optional[int] = None):
         if max_file_size:
             self.MAX_FILE_SIZE = max_file_size
+        # path -> (st_mtime_ns, st_size, ConfigInput), least recently used
+        # first; a changed file replaces its path's entry
+        self._cache: OrderedDict = OrderedDict()
+        # load_directory reads files from several threads
+        self._cache_lock = threading.Lock()
 
     def load_file(self, file_path: str) -> ConfigInput:
         """
@@ -44,20 +64,28 @@ class InputHandler:
         # Normalize path
         file_path = os.path.abspath(file_path)
 
-        # Check existence
-        if not os.path.exists(file_path):
+        # Check existence (one stat serves the type and size checks too)
+        try:
+            st = os.stat(file_path)
+        except (FileNotFoundError, NotADirectoryError):
             raise FileNotFoundError(f"Configuration file not found: {file_path}")
 
         # Check it's a file (not directory)
-        if not os.path.isfile(file_path):
+        if not stat.S_ISREG(st.st_mode):
             raise ValueError(f"Path is not a file: {file_path}")
 
-        # Check readability
-        if not os.access(file_path, os.R_OK):
-            raise PermissionError(f"File is not readable: {file_path}")
+        # Readability is checked by the open itself in _load_file_with_stat
+        return self._load_file_with_stat(file_path, st)
+
+    def _load_file_with_stat(self, file_path: str, st: os.stat_result) -> ConfigInput:
+        """
+        Read, decode, and hash a file whose stat result is already known.
 
+        Callers are responsible for the existence/type checks; this only
+        enforces the size limits and reads the content.
+        """
         # Check file size
-        file_size = os.path.getsize(file_path)
+        file_size = st.st_size
         if file_size == 0:
             raise ValueError(f"Configuration file is empty: {file_path}")
         if file_size > self.MAX_FILE_SIZE:
@@ -65,17 +93,84 @@ class InputHandler:
                 f"File exceeds maximum size ({self.MAX_FILE_SIZE} bytes): {file_path}"
             )
 
-        # Read content
+        # Unchanged since the last load: reuse content and hash, skip the read
+        with self._cache_lock:
+            entry = self._cache.get(file_path)
+            if entry is not None and entry[0] == st.st_mtime_ns and entry[1] == file_size:
+                self._cache.move_to_end(file_path)
+                return replace(entry[2], timestamp=datetime.now().isoformat())
+
+        # Read raw bytes in one unbuffered read sized to the known file size
+        try:
+            fd = os.open(file_path, _OPEN_FLAGS)
+        except PermissionError:
+            raise PermissionError(f"File is not readable: {file_path}")
+        try:
+            raw = os.read(fd, file_size)
+            if len(raw) < file_size:
+                raw = self._read_remaining(fd, raw, file_size)
+        finally:
+            os.close(fd)
+
+        config_input = self._build_input(raw, file_path, os.path.basename(file_path), file_size)
+        with self._cache_lock:
+            self._cache[file_path] = (st.st_mtime_ns, file_size, config_input)
+            self._cache.move_to_end(file_path)
+            if len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return replace(config_input)
+
+    def load_bytes(self, data: bytes, filename: str) -> ConfigInput:
+        """
+        Load and validate configuration content that is already in memory.
+
+        Used for uploads, which would otherwise be written to disk only to
+        be read back by load_file.
+
+        Args:
+            data: Raw file content.
+            filename: Original file name, used for vendor detection.
+
+        Returns:
+            ConfigInput object with file content and metadata; path is the
+            filename since there is no file on disk.
+
+        Raises:
+            ValueError: If the content is empty, too large, or binary.
+        """
+        if not data:
+            raise ValueError(f"Configuration file is empty: {filename}")
+        if len(data) > self.MAX_FILE_SIZE:
+            raise ValueError(
+                f"File exceeds maximum size ({self.MAX_FILE_SIZE} bytes): {filename}"
+            )
+        return self._build_input(data, filename, filename, len(data))
+
+    @staticmethod
+    def _build_input(raw: bytes, file_path: str, filename: str, file_size: int) -> ConfigInput:
+        """Decode and hash raw file bytes into a ConfigInput."""
+        # NUL bytes never appear in text configs; reject obvious binaries
+        # from the prefix instead of decoding the whole buffer first
+        if b'\x00' in raw[:_SNIFF_SIZE]:
+            raise ValueError(
+                f"File appears to be binary or uses unsupported encoding: {file_path}"
+            )
+
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='strict') as f:
-                content = f.read()
+            content = raw.decode('utf-8', errors='strict')
         except UnicodeDecodeError:
             raise ValueError(
                 f"File appears to be binary or uses unsupported encoding: {file_path}"
             )
 
-        # Compute SHA-256 hash
-        file_hash = hashlib.sha256(content.encode('utf-8')).hexdigest()
+        # Match text-mode universal newline handling
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+
+        # Compute BLAKE2b-256 hash over the raw bytes (no re-encode)
+        h = hashlib.blake2b(digest_size=32)
+        h.update(raw)
+        file_hash = h.digest()
 
         return ConfigInput(
             path=file_path,
@@ -83,9 +178,30 @@ class InputHandler:
             file_hash=file_hash,
             file_size=file_size,
             timestamp=datetime.now().isoformat(),
-            filename=os.path.basename(file_path)
+            filename=filename,
+            hash_algo="blake2b"
         )
 
+    @staticmethod
+    def _read_remaining(fd: int, head: bytes, file_size: int) -> bytearray:
+        """
+        Finish a short read into a buffer reserved up front for the whole file.
+
+        Regular files almost always arrive in one os.read; network and FUSE
+        filesystems may not, so fill the rest with unbuffered readinto calls.
+        """
+        buf = bytearray(file_size)
+        n = len(head)
+        buf[:n] = head
+        with memoryview(buf) as view, open(fd, 'rb', buffering=0, closefd=False) as f:
+            while n < file_size:
+                got = f.readinto(view[n:])
+                if not got:
+                    break
+                n += got
+        del buf[n:]
+        return buf
+
     def load_directory(self, dir_path: str) -> Tuple[List[ConfigInput], List[Dict[str, str]]]:
         """
         Load all configuration files from a directory.
@@ -104,19 +220,37 @@ class InputHandler:
         results = []
         errors = []
 
-        for filename in sorted(os.listdir(dir_path)):
-            file_path = os.path.join(dir_path, filename)
-            if not os.path.isfile(file_path):
+        with os.scandir(dir_path) as it:
+            entries = sorted(it, key=lambda e: e.name)
+
+        candidates = []
+        for entry in entries:
+            if not entry.is_file():
                 continue
 
-            _, ext = os.path.splitext(filename)
-            if ext.lower() not in self.SUPPORTED_EXTENSIONS:
+            name = entry.name.lower()
+            dot = name.rfind('.')
+            if dot < 0 or name[dot:] not in self.SUPPORTED_EXTENSIONS:
                 continue
 
+            candidates.append(entry)
+
+        if not candidates:
+            return results, errors
+
+        # Reads and hashing release the GIL, so load files concurrently;
+        # results are collected in sorted entry order for determinism.
+        max_workers = min(32, (os.cpu_count() or 4) * 2, len(candidates))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self._load_file_with_stat, entry.path, entry.stat())
+                for entry in candidates
+            ]
+
+        for entry, future in zip(candidates, futures):
             try:
-                config_input = self.load_file(file_path)
-                results.append(config_input)
+                results.append(future.result())
             except (ValueError, PermissionError) as e:
-                errors.append({"file": file_path, "error": str(e)})
+                errors.append({"file": entry.path, "error": str(e)})
 
         return results, errors
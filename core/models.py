@@ -3,23 +3,37 @@ SmartISMS Data Models
 Core data structures used throughout the compliance engine.
 """
 
+import re
+import sys
+import time
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, Callable, Optional
 from datetime import datetime
 
 
-@dataclass
+# Rule severity -> small int code, used to index penalty tables
+SEVERITY_CODES = {"high": 0, "medium": 1, "low": 2}
+
+
+@dataclass(slots=True)
 class ConfigInput:
     """Represents a loaded configuration file."""
     path: str
     content: str
-    file_hash: str  # SHA-256
+    file_hash: bytes  # Raw digest, algorithm given by hash_algo
     file_size: int
     timestamp: str
     filename: str
+    hash_algo: str = "blake2b"  # blake2b (256-bit digest)
 
+    @property
+    def file_hash_hex(self) -> str:
+        """Hex form of file_hash for display and JSON output."""
+        return self.file_hash.hex()
 
-@dataclass
+
+@dataclass(slots=True)
 class VendorInfo:
     """Result of vendor detection."""
     vendor_name: str        # cisco | junos | nginx | apache | linux | firewall
@@ -28,18 +42,38 @@ class VendorInfo:
     matched_patterns: list = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedConfig:
     """Structured representation of a parsed config file."""
     vendor: str
     sections: dict = field(default_factory=dict)    # Hierarchical structure
     flat_keys: dict = field(default_factory=dict)   # Flattened key-value pairs
     blocks: list = field(default_factory=list)       # Named blocks found
-    raw_lines: list = field(default_factory=list)    # Original lines for reference
     interfaces: dict = field(default_factory=dict)   # Interface-specific configs
+    content: str = field(default="", repr=False)     # Original text; raw_lines splits it lazily
+    _raw_lines: Optional[list] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def raw_lines(self) -> list:
+        """Original lines for reference (split from content on first access)."""
+        if self._raw_lines is None:
+            # Same split as line_count counts: '\n' only, trailing '' kept
+            self._raw_lines = self.content.split('\n') if self.content else []
+        return self._raw_lines
 
+    @raw_lines.setter
+    def raw_lines(self, lines: list):
+        self._raw_lines = lines
 
-@dataclass
+    @property
+    def line_count(self) -> int:
+        """Number of lines in the original content, without building raw_lines."""
+        if self.content:
+            return self.content.count('\n') + 1
+        return len(self._raw_lines or [])
+
+
+@dataclass(slots=True)
 class NormalizedConfig:
     """Vendor-agnostic canonical representation for rule evaluation."""
     vendor: str
@@ -47,15 +81,23 @@ class NormalizedConfig:
     blocks: dict = field(default_factory=dict)       # Block name -> block content dict
     metadata: dict = field(default_factory=dict)     # File metadata
 
+    @property
+    def content_key(self) -> tuple:
+        """
+        Hashable snapshot of everything rule evaluation can observe.
+
+        Two configs with equal content keys produce identical rule results.
+        """
+        return (self.vendor, frozenset(self.entries.items()), frozenset(self.blocks))
+
     def get(self, key: str, default=None):
         """Get a normalized config value by key (case-insensitive)."""
-        key_lower = key.lower().strip()
+        key_lower, key_compact = _norm_query(key)
         # Direct match
         if key_lower in self.entries:
             return self.entries[key_lower]
         # Try without extra spaces
-        key_compact = " ".join(key_lower.split())
-        if key_compact in self.entries:
+        if key_compact is not key_lower and key_compact in self.entries:
             return self.entries[key_compact]
         return default
 
@@ -63,29 +105,83 @@ class NormalizedConfig:
         """Check if a key exists in normalized config."""
         return self.get(key) is not None
 
+    def __contains__(self, key: str) -> bool:
+        return self.has_key(key)
+
     def has_block(self, block_name: str) -> bool:
         """Check if a named block exists."""
-        block_lower = block_name.lower().strip()
-        return block_lower in self.blocks
+        return _norm_query(block_name)[0] in self.blocks
 
     def get_block(self, block_name: str) -> dict:
         """Get contents of a named block."""
-        return self.blocks.get(block_name.lower().strip(), {})
+        return self.blocks.get(_norm_query(block_name)[0], {})
+
+
+@lru_cache(maxsize=512)
+def _compile_pattern(source: str) -> re.Pattern:
+    """Compile a rule regex once per distinct pattern (case-insensitive)."""
+    return re.compile(source, re.IGNORECASE)
+
+
+@lru_cache(maxsize=4096)
+def _norm_query(key: str) -> tuple:
+    """
+    Case-fold a lookup key once per distinct string.
 
+    Returns (lowercased+stripped, whitespace-compacted); the second item is
+    the same object as the first when there is nothing to compact.
+    """
+    key_lower = key.lower().strip()
+    key_compact = " ".join(key_lower.split())
+    if key_compact == key_lower:
+        return key_lower, key_lower
+    return key_lower, key_compact
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class RuleCondition:
     """Defines the condition logic for a rule."""
     type: str               # key_value_match | block_exists | regex_match | negation | compound
     scope: str = "global"   # global | interface | block:<name>
     key: str = ""
     operator: str = "equals"  # equals | not_equals | contains | regex | gte | lte | exists | not_exists
-    expected_value: Any = None
-    sub_conditions: list = field(default_factory=list)   # For compound type
+    expected_value: Any = field(default=None, hash=False)
+    sub_conditions: list = field(default_factory=list, hash=False)   # For compound type
     logical_operator: str = "AND"                        # AND | OR for compound
+    # Derived at construction: case-folded key/expected value for matching,
+    # the compiled pattern for regex_match / "regex" (or the re.error
+    # message if the pattern is invalid)
+    key_norm: str = field(default="", init=False, repr=False, compare=False)
+    negated_key_norm: str = field(default="", init=False, repr=False, compare=False)
+    expected_norm: str = field(default="", init=False, repr=False, compare=False)
+    pattern: Optional[re.Pattern] = field(default=None, init=False, repr=False, compare=False)
+    pattern_error: str = field(default="", init=False, repr=False, compare=False)
+    # Comparison specialized for the operator by rule_engine.prepare_condition:
+    # compare_fn(actual_norm, compare_arg) -> bool
+    compare_fn: Optional[Callable] = field(default=None, init=False, repr=False, compare=False)
+    compare_arg: Any = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        key_norm = self.key.lower().strip()
+        expected_norm = str(self.expected_value).lower().strip()
+        object.__setattr__(self, "key_norm", key_norm)
+        object.__setattr__(self, "negated_key_norm", f"no {key_norm}")
+        object.__setattr__(self, "expected_norm", expected_norm)
+
+        if self.type == "regex_match":
+            source = str(self.expected_value)
+        elif self.operator == "regex":
+            # Operator comparisons run on the lowered, stripped expected value
+            source = expected_norm
+        else:
+            return
+        try:
+            object.__setattr__(self, "pattern", _compile_pattern(source))
+        except re.error as e:
+            object.__setattr__(self, "pattern_error", str(e))
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Rule:
     """Complete rule definition for compliance evaluation."""
     rule_id: str
@@ -100,11 +196,23 @@ class Rule:
     condition: RuleCondition
     remediation_text: str
     remediation_command: str
-    cross_standard_refs: list = field(default_factory=list)
-    metadata: dict = field(default_factory=dict)
+    cross_standard_refs: list = field(default_factory=list, hash=False)
+    metadata: dict = field(default_factory=dict, hash=False)
+    # Derived at construction for filtering/indexing
+    vendor_norm: str = field(default="", init=False, repr=False, compare=False)
+    standard_norm: str = field(default="", init=False, repr=False, compare=False)
+    severity_code: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+    max_contribution: int = field(default=0, init=False, repr=False, compare=False)
 
+    def __post_init__(self):
+        object.__setattr__(self, "vendor_norm", sys.intern(self.vendor.lower()))
+        object.__setattr__(self, "standard_norm", sys.intern(self.standard.upper()))
+        object.__setattr__(self, "severity_code", SEVERITY_CODES.get(self.severity.lower()))
+        # A rule's share of the maximum score (weight x worst-case penalty)
+        object.__setattr__(self, "max_contribution", self.weight * 5)
 
-@dataclass
+
+@dataclass(slots=True)
 class RuleResult:
     """Result of evaluating a single rule."""
     rule: Rule
@@ -112,10 +220,15 @@ class RuleResult:
     found_value: Any = None
     expected_value: Any = None
     reason: str = ""
-    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+    timestamp: float = field(default_factory=time.time)  # Epoch seconds
+
+    @property
+    def timestamp_iso(self) -> str:
+        """Evaluation time as an ISO-8601 string (formatted on demand)."""
+        return datetime.fromtimestamp(self.timestamp).isoformat()
 
 
-@dataclass
+@dataclass(slots=True)
 class ClassifiedResult:
     """Rule result with penalty classification applied."""
     rule_result: RuleResult
@@ -125,7 +238,46 @@ class ClassifiedResult:
     status_label: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
+class ClassifiedBatch:
+    """
+    Column-oriented view of a list of classified results.
+
+    The scoring fields are held in parallel lists so ScoreCalculator can
+    sweep them without dereferencing each result; ``results`` keeps the
+    per-rule objects for reporting.
+    """
+    results: list = field(default_factory=list)      # ClassifiedResult per rule
+    standards: list = field(default_factory=list)    # rule.standard
+    categories: list = field(default_factory=list)   # rule.category
+    statuses: list = field(default_factory=list)     # status_label
+    severities: list = field(default_factory=list)   # severity_label
+    max_scores: list = field(default_factory=list)   # rule.max_contribution
+    penalties: list = field(default_factory=list)    # weighted_penalty
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def append(self, cr: "ClassifiedResult"):
+        """Add one classified result to every column."""
+        rule = cr.rule_result.rule
+        self.results.append(cr)
+        self.standards.append(rule.standard)
+        self.categories.append(rule.category)
+        self.statuses.append(cr.status_label)
+        self.severities.append(cr.severity_label)
+        self.max_scores.append(rule.max_contribution)
+        self.penalties.append(cr.weighted_penalty)
+
+    @classmethod
+    def from_results(cls, results: list) -> "ClassifiedBatch":
+        batch = cls()
+        for cr in results:
+            batch.append(cr)
+        return batch
+
+
+@dataclass(slots=True)
 class StandardScore:
     """Compliance score for a single standard."""
     standard: str
@@ -141,7 +293,7 @@ class StandardScore:
     errored: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ComplianceScore:
     """Overall compliance scoring result."""
     raw_score: float
@@ -159,7 +311,7 @@ class ComplianceScore:
     severity_distribution: dict = field(default_factory=dict)  # severity -> count
 
 
-@dataclass
+@dataclass(slots=True)
 class CrossStandardMapping:
     """Maps equivalent controls across different standards."""
     mapping_id: str
@@ -168,7 +320,7 @@ class CrossStandardMapping:
     mappings: list = field(default_factory=list)  # list of {standard, control_id, section}
 
 
-@dataclass
+@dataclass(slots=True)
 class EvaluationReport:
     """Complete evaluation report data."""
     config_input: ConfigInput
@@ -177,5 +329,10 @@ class EvaluationReport:
     classified_results: list       # list[ClassifiedResult]
     cross_mappings: list           # list[CrossStandardMapping]
     standards_evaluated: list
-    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+    timestamp: float = field(default_factory=time.time)  # Epoch seconds
     engine_version: str = "1.0.0"
+
+    @property
+    def timestamp_iso(self) -> str:
+        """Report time as an ISO-8601 string (formatted on demand)."""
+        return datetime.fromtimestamp(self.timestamp).isoformat()
@@ -4,6 +4,9 @@ Transforms vendor-specific parsed configs into a canonical schema
 for vendor-agnostic rule evaluation.
 """
 
+import re
+from functools import lru_cache
+
 from core.models import ParsedConfig, NormalizedConfig  # pyre-ignore
 
 
@@ -29,41 +32,47 @@ class Normalizer:
         """
         normalized = NormalizedConfig(
             vendor=parsed.vendor,
-            metadata={"raw_line_count": len(parsed.raw_lines)}
+            metadata={"raw_line_count": parsed.line_count}
         )
 
+        norm_key = self._normalize_key
+        norm_value = self._normalize_value
+        entries = normalized.entries
+
         # Normalize flat keys
-        for key, value in parsed.flat_keys.items():
-            norm_key = self._normalize_key(key)
-            norm_value = self._normalize_value(value)
-            normalized.entries[norm_key] = norm_value
+        entries.update({
+            norm_key(key): norm_value(value)
+            for key, value in parsed.flat_keys.items()
+        })
 
         # Normalize sections into blocks
-        for section_name, section_data in parsed.sections.items():
-            norm_block_name = self._normalize_key(section_name)
-            if isinstance(section_data, dict):
-                norm_block = {}
-                for k, v in section_data.items():
-                    norm_k = self._normalize_key(k)
-                    norm_v = self._normalize_value(v)
-                    norm_block[norm_k] = norm_v
-
-                    # Also add flattened block.key entry
-                    flat_key = f"{norm_block_name}::{norm_k}"
-                    normalized.entries[flat_key] = norm_v
-
-                normalized.blocks[norm_block_name] = norm_block
+        if parsed.sections:
+            for section_name, section_data in parsed.sections.items():
+                norm_block_name = norm_key(section_name)
+                if isinstance(section_data, dict):
+                    norm_block = {
+                        norm_key(k): norm_value(v) for k, v in section_data.items()
+                    }
+
+                    # Also add flattened block.key entries
+                    entries.update({
+                        f"{norm_block_name}::{norm_k}": norm_v
+                        for norm_k, norm_v in norm_block.items()
+                    })
+
+                    normalized.blocks[norm_block_name] = norm_block
 
         # Normalize interface configs
         if parsed.interfaces:
             for iface_name, iface_data in parsed.interfaces.items():
-                norm_iface = self._normalize_key(f"interface {iface_name}")
-                norm_block = {}
-                for k, v in iface_data.items():
-                    norm_k = self._normalize_key(k)
-                    norm_v = self._normalize_value(v)
-                    norm_block[norm_k] = norm_v
-                    normalized.entries[f"{norm_iface}::{norm_k}"] = norm_v
+                norm_iface = norm_key(f"interface {iface_name}")
+                norm_block = {
+                    norm_key(k): norm_value(v) for k, v in iface_data.items()
+                }
+                entries.update({
+                    f"{norm_iface}::{norm_k}": norm_v
+                    for norm_k, norm_v in norm_block.items()
+                })
                 normalized.blocks[norm_iface] = norm_block
 
         return normalized
@@ -72,17 +81,7 @@ class Normalizer:
         """Normalize a configuration key."""
         if not key:
             return key
-
-        # Lowercase
-        key = key.lower().strip()
-
-        # Compact multiple spaces
-        key = ' '.join(key.split())
-
-        # Apply common abbreviations
-        key = self._resolve_abbreviations(key)
-
-        return key
+        return _norm_key_cached(key)
 
     def _normalize_value(self, value) -> str:
         """Normalize a configuration value."""
@@ -92,41 +91,79 @@ class Normalizer:
             return str(value)
         if isinstance(value, bool):
             return "yes" if value else "no"
+        return _norm_value_cached(str(value))
 
-        value = str(value).strip()
+    def _resolve_abbreviations(self, key: str) -> str:
+        """Resolve common vendor abbreviations to canonical forms."""
+        return _resolve_abbreviations(key)
 
-        # Normalize boolean-like values
-        value_lower = value.lower()
-        bool_true = {"yes", "on", "true", "enable", "enabled", "1"}
-        bool_false = {"no", "off", "false", "disable", "disabled", "0"}
 
-        if value_lower in bool_true:
-            return "yes"
-        elif value_lower in bool_false:
-            return "no"
+_BOOL_TRUE = frozenset({"yes", "on", "true", "enable", "enabled", "1"})
+_BOOL_FALSE = frozenset({"no", "off", "false", "disable", "disabled", "0"})
+_QUOTE_CHARS = frozenset({'"', "'"})
 
-        # Remove surrounding quotes
-        if (value.startswith('"') and value.endswith('"')) or \
-           (value.startswith("'") and value.endswith("'")):
-            value = str(value)[1:-1]  # pyre-ignore
+# Keys and values repeat heavily across a config (and across configs in a
+# batch), so the string work below is memoized at module level.
 
-        return value
+@lru_cache(maxsize=4096)
+def _norm_key_cached(key: str) -> str:
+    """Lowercase, compact whitespace, and expand abbreviations in a key."""
+    # Lowercase
+    key = key.lower().strip()
+
+    # Compact multiple spaces
+    key = ' '.join(key.split())
+
+    # Apply common abbreviations
+    return _resolve_abbreviations(key)
+
+
+@lru_cache(maxsize=4096)
+def _norm_value_cached(value: str) -> str:
+    """Canonicalize boolean-like values and strip surrounding quotes."""
+    value = value.strip()
+
+    # Normalize boolean-like values
+    value_lower = value.lower()
+
+    if value_lower in _BOOL_TRUE:
+        return "yes"
+    elif value_lower in _BOOL_FALSE:
+        return "no"
+
+    # Remove surrounding quotes
+    quote = value[:1]
+    if quote in _QUOTE_CHARS and value[-1:] == quote:
+        return value[1:-1]
+
+    return value
 
-    def _resolve_abbreviations(self, key: str) -> str:
-        """Resolve common vendor abbreviations to canonical forms."""
-        abbreviations = {
-            "gig": "gigabitethernet",
-            "fa": "fastethernet",
-            "eth": "ethernet",
-            "lo": "loopback",
-            "po": "port-channel",
-            "gi": "gigabitethernet",
-            "te": "tengigeethernet",
-        }
-
-        for abbr, full in abbreviations.items():
-            # Only replace at word boundaries within interface names
-            if f"interface {abbr}" in key:
-                key = key.replace(f"interface {abbr}", f"interface {full}", 1)
 
+def _resolve_abbreviations(key: str) -> str:
+    """Resolve common vendor abbreviations to canonical forms."""
+    if "interface " not in key:
         return key
+    return _ABBR_RE.sub(_expand_abbreviation, key, count=1)
+
+
+def _expand_abbreviation(match) -> str:
+    return match.group(1) + _ABBREVIATIONS[match.group(2)]
+
+
+_ABBREVIATIONS = {
+    "gig": "gigabitethernet",
+    "fa": "fastethernet",
+    "eth": "ethernet",
+    "lo": "loopback",
+    "po": "port-channel",
+    "gi": "gigabitethernet",
+    "te": "tengigeethernet",
+}
+
+# Longest abbreviation first; the negative lookahead keeps full names such
+# as "gigabitethernet0/1" or "loopback0" from being expanded again.
+_ABBR_RE = re.compile(
+    r"\b(interface )("
+    + "|".join(re.escape(a) for a in sorted(_ABBREVIATIONS, key=len, reverse=True))
+    + r")(?![a-z])"
+)
@@ -4,27 +4,45 @@ Routes configuration files to the appropriate vendor parser
 and returns a structured ParsedConfig object.
 """
 
+import sys
+import importlib
+from typing import Callable, Optional
+
 from core.models import ConfigInput, VendorInfo, ParsedConfig  # pyre-ignore
-from parsers.cisco_parser import CiscoParser  # pyre-ignore
-from parsers.junos_parser import JunOSParser  # pyre-ignore
-from parsers.nginx_parser import NginxParser  # pyre-ignore
-from parsers.apache_parser import ApacheParser  # pyre-ignore
-from parsers.linux_parser import LinuxParser  # pyre-ignore
-from parsers.firewall_parser import FirewallParser  # pyre-ignore
+
+
+# Vendor -> (module, class) of its parser. Parser modules are imported on
+# first use, so a run only loads the parser for the vendor it detected.
+_PARSER_CLASSES = {
+    "cisco": ("parsers.cisco_parser", "CiscoParser"),
+    "junos": ("parsers.junos_parser", "JunOSParser"),
+    "nginx": ("parsers.nginx_parser", "NginxParser"),
+    "apache": ("parsers.apache_parser", "ApacheParser"),
+    "linux": ("parsers.linux_parser", "LinuxParser"),
+    "firewall": ("parsers.firewall_parser", "FirewallParser"),
+}
 
 
 class ParserEngine:
     """Routes config files to the correct vendor parser."""
 
     def __init__(self):
-        self._parsers = {
-            "cisco": CiscoParser(),
-            "junos": JunOSParser(),
-            "nginx": NginxParser(),
-            "apache": ApacheParser(),
-            "linux": LinuxParser(),
-            "firewall": FirewallParser(),
-        }
+        self._parsers = {}
+        # Pre-bound parse methods: one dict probe per file, no method binding
+        self._parse_fn = {}
+
+    def _get_parse_fn(self, vendor: str) -> Optional[Callable[[str], ParsedConfig]]:
+        """Return the vendor's bound parse method, importing its parser on first use."""
+        parse_fn = self._parse_fn.get(vendor)
+        if parse_fn is None:
+            spec = _PARSER_CLASSES.get(vendor)
+            if spec is None:
+                return None
+            module_name, class_name = spec
+            parser = getattr(importlib.import_module(module_name), class_name)()
+            self._parsers[vendor] = parser
+            parse_fn = self._parse_fn[vendor] = parser.parse
+        return parse_fn
 
     def parse(self, config_input: ConfigInput, vendor_info: VendorInfo) -> ParsedConfig:
         """
@@ -40,27 +58,26 @@ class ParserEngine:
         Raises:
             ValueError: If vendor is unsupported or unknown.
         """
-        vendor = vendor_info.vendor_name.lower()
-
-        if vendor == "unknown":
-            raise ValueError(
-                f"Cannot parse file '{config_input.filename}': unknown vendor. "
-                f"Vendor detection confidence was {vendor_info.confidence}"
-            )
+        vendor = sys.intern(vendor_info.vendor_name.lower())
 
-        if vendor not in self._parsers:
+        parse_fn = self._get_parse_fn(vendor)
+        if parse_fn is None:
+            if vendor == "unknown":
+                raise ValueError(
+                    f"Cannot parse file '{config_input.filename}': unknown vendor. "
+                    f"Vendor detection confidence was {vendor_info.confidence}"
+                )
             raise ValueError(
                 f"No parser available for vendor '{vendor}'. "
-                f"Supported vendors: {list(self._parsers.keys())}"
+                f"Supported vendors: {self.supported_vendors}"
             )
 
-        parser = self._parsers[vendor]
-        parsed = parser.parse(config_input.content)
+        parsed = parse_fn(config_input.content)
         parsed.vendor = vendor
-        parsed.raw_lines = config_input.content.split('\n')
+        parsed.content = config_input.content
 
         return parsed
 
     @property
     def supported_vendors(self) -> list:
-        return list(self._parsers.keys())
+        return list(_PARSER_CLASSES)
@@ -5,27 +5,269 @@ Renders professional HTML/PDF compliance reports using Jinja2 templates.
 
 import os
 import json
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import List, Optional
+from typing import Iterator, List, Optional, Sequence
 from core.models import (  # pyre-ignore
     ConfigInput, VendorInfo, ComplianceScore,
     ClassifiedResult, EvaluationReport
 )
 
 try:
-    from jinja2 import Environment, FileSystemLoader  # pyre-ignore
+    from jinja2 import (  # pyre-ignore
+        Environment, FileSystemLoader, FileSystemBytecodeCache, select_autoescape
+    )
     JINJA2_AVAILABLE = True
 except ImportError:
     JINJA2_AVAILABLE = False
 
+try:
+    import orjson  # pyre-ignore
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# HTML escape table for interpolated text; str.translate runs in one C pass
+_ESC = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;'})
+
+
+def _e(value) -> str:
+    """HTML-escape a value for interpolation into the built-in report."""
+    return str(value).translate(_ESC)
+
+
+def _bytecode_cache():
+    """
+    Return an on-disk Jinja2 bytecode cache shared by all processes.
+
+    Compiled templates are keyed by source checksum, so later runs skip
+    template compilation entirely. Returns None if the cache directory
+    cannot be created (e.g. read-only home).
+    """
+    cache_root = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    directory = os.path.join(cache_root, 'smartisms', 'jinja')
+    try:
+        os.makedirs(directory, exist_ok=True)
+    except OSError:
+        return None
+    return FileSystemBytecodeCache(directory)
+
+
+def _flatten_cross_mappings(cross_mappings: list) -> List[tuple]:
+    """
+    Flatten cross-standard mappings into one row tuple per mapped control.
+
+    Rows are (canonical_control, description, standard, control_id, section);
+    non-dict entries are skipped.
+    """
+    return [
+        (c.get('canonical_control', ''), c.get('description', ''),
+         m.get('standard', ''), m.get('control_id', ''), m.get('section', ''))
+        for c in cross_mappings if isinstance(c, dict)
+        for m in c.get('mappings', ())
+    ]
+
+
+def _json_default(obj):
+    """Serialize the non-JSON types that can appear in report data."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, (bytes, bytearray)):
+        return obj.hex()
+    return str(obj)
+
+
+# Row CSS classes by label; unknown statuses (ERROR, SKIPPED) render as "warn"
+_SEV_CLASS = {"high": "severity-high", "medium": "severity-medium", "low": "severity-low"}
+_STATUS_CLASS = {"PASS": "pass", "FAIL": "fail", "WARNING": "warn", "ERROR": "warn"}
+
+
+# Static stylesheet for the built-in report (plain string: no brace escaping)
+_STATIC_CSS = """        :root {
+            --bg: #0f172a; --surface: #1e293b; --surface2: #334155;
+            --text: #e2e8f0; --text-muted: #94a3b8; --border: #475569;
+            --pass: #22c55e; --warn: #eab308; --fail: #ef4444;
+            --high: #ef4444; --medium: #f59e0b; --low: #3b82f6;
+            --accent: #6366f1;
+        }
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body { font-family: 'Segoe UI', system-ui, -apple-system, sans-serif; background: var(--bg); color: var(--text); line-height: 1.6; padding: 2rem; }
+        .container { max-width: 1200px; margin: 0 auto; }
+        h1 { font-size: 2rem; margin-bottom: 0.5rem; background: linear-gradient(135deg, var(--accent), #a78bfa); -webkit-background-clip: text; -webkit-text-fill-color: transparent; }
+        h2 { font-size: 1.4rem; margin: 2rem 0 1rem; padding-bottom: 0.5rem; border-bottom: 2px solid var(--accent); color: var(--accent); }
+        h3 { font-size: 1.1rem; margin: 1.5rem 0 0.5rem; color: var(--text); }
+        .header { background: var(--surface); border-radius: 12px; padding: 2rem; margin-bottom: 2rem; border: 1px solid var(--border); }
+        .header-meta { display: flex; gap: 2rem; margin-top: 1rem; color: var(--text-muted); font-size: 0.9rem; flex-wrap: wrap; }
+        .score-hero { display: flex; align-items: center; gap: 2rem; margin-top: 1.5rem; }
+        .score-circle { width: 120px; height: 120px; border-radius: 50%; display: flex; align-items: center; justify-content: center; font-size: 2rem; font-weight: 700; border: 4px solid; }
+        .risk-label { font-size: 1.2rem; font-weight: 600; padding: 0.4rem 1rem; border-radius: 8px; }
+        .stats-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(150px, 1fr)); gap: 1rem; margin-top: 1rem; }
+        .stat-card { background: var(--surface2); border-radius: 8px; padding: 1rem; text-align: center; }
+        .stat-card .value { font-size: 1.8rem; font-weight: 700; }
+        .stat-card .label { color: var(--text-muted); font-size: 0.85rem; }
+        .card { background: var(--surface); border-radius: 12px; padding: 1.5rem; margin-bottom: 1.5rem; border: 1px solid var(--border); overflow-x: auto; }
+        table { width: 100%; border-collapse: collapse; font-size: 0.9rem; }
+        th { background: var(--surface2); padding: 0.75rem; text-align: left; font-weight: 600; white-space: nowrap; }
+        td { padding: 0.75rem; border-top: 1px solid var(--border); }
+        tr:hover { background: rgba(99, 102, 241, 0.05); }
+        .badge { padding: 0.2rem 0.6rem; border-radius: 4px; font-size: 0.8rem; font-weight: 600; display: inline-block; }
+        .pass { color: var(--pass); } .warn { color: var(--warn); } .fail { color: var(--fail); }
+        .badge.pass { background: rgba(34,197,94,0.15); } .badge.warn { background: rgba(234,179,8,0.15); } .badge.fail { background: rgba(239,68,68,0.15); }
+        .severity-high { color: var(--high); } .severity-medium { color: var(--medium); } .severity-low { color: var(--low); }
+        .badge.severity-high { background: rgba(239,68,68,0.15); } .badge.severity-medium { background: rgba(245,158,11,0.15); } .badge.severity-low { background: rgba(59,130,246,0.15); }
+        .risk-badge { padding: 0.25rem 0.8rem; border-radius: 6px; font-size: 0.8rem; font-weight: 600; color: #fff; }
+        code { background: var(--surface2); padding: 0.15rem 0.4rem; border-radius: 4px; font-size: 0.85rem; }
+        pre { background: var(--surface2); padding: 0.75rem; border-radius: 6px; overflow-x: auto; margin: 0; }
+        pre code { background: none; padding: 0; }
+        .bar-row { display: flex; align-items: center; gap: 0.75rem; margin: 0.5rem 0; }
+        .bar-label { width: 70px; font-weight: 600; font-size: 0.85rem; }
+        .bar-container { flex: 1; height: 24px; background: var(--surface2); border-radius: 4px; overflow: hidden; }
+        .bar { height: 100%; border-radius: 4px; transition: width 0.5s ease; }
+        .severity-high-bg { background: var(--high); } .severity-medium-bg { background: var(--medium); } .severity-low-bg { background: var(--low); }
+        .bar-value { width: 30px; text-align: right; font-weight: 600; font-size: 0.9rem; }
+        .footer { text-align: center; color: var(--text-muted); font-size: 0.8rem; margin-top: 3rem; padding-top: 1rem; border-top: 1px solid var(--border); }
+        @media print { body { background: #fff; color: #000; } .card,.header { border: 1px solid #ddd; } th { background: #f3f4f6; } }
+"""
+
+# One severity distribution bar
+_BAR_FMT = """
+            <div class="bar-row">
+                <span class="bar-label">{level}</span>
+                <div class="bar-container">
+                    <div class="bar severity-{cls}-bg" style="width:{w}%"></div>
+                </div>
+                <span class="bar-value">{n}</span>
+            </div>"""
+
+# Row formats for the built-in report, filled with str.format_map from one
+# per-result field dict (values are pre-escaped)
+_FAILED_ROW = """
+            <tr class="{sev_class}">
+                <td><code>{rule_id}</code></td>
+                <td>{title}</td>
+                <td><span class="badge {status_class}">{status}</span></td>
+                <td><span class="badge {sev_class}">{sev_up}</span></td>
+                <td>{standard}</td>
+                <td><code>{found}</code></td>
+                <td><code>{expected}</code></td>
+            </tr>"""
+
+_REMEDIATION_ROW = """
+            <tr>
+                <td><code>{rule_id}</code></td>
+                <td><span class="badge {sev_class}">{sev_up}</span></td>
+                <td>{remediation}</td>
+                <td><pre><code>{command}</code></pre></td>
+            </tr>"""
+
+_APPENDIX_ROW = """
+            <tr>
+                <td><code>{rule_id}</code></td>
+                <td>{title}</td>
+                <td>{standard}</td>
+                <td><span class="badge {status_class}">{status}</span></td>
+                <td>{sev_up}</td>
+                <td>{penalty}</td>
+            </tr>"""
+
+_CROSS_ROW = """
+            <tr>
+                <td>{0}</td>
+                <td>{1}</td>
+                <td>{2}</td>
+                <td>{3}</td>
+                <td>{4}</td>
+            </tr>"""
+
+# Document preamble up to the dynamic header fields
+_HTML_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>SmartISMS Compliance Report</title>
+    <style>
+""" + _STATIC_CSS + """    </style>
+</head>
+<body>
+<div class="container">
+
+    <!-- 1. Header & Executive Summary -->
+    <div class="header">
+        <h1>🛡️ SmartISMS Compliance Report</h1>
+        <div class="header-meta">
+"""
+
 
 class ReportGenerator:
     """Generates professional compliance reports in HTML and PDF formats."""
 
+    # Shared across instances: templates_dir -> Environment, and
+    # (templates_dir, name) -> compiled Template
+    _env_cache: dict = {}
+    _template_cache: dict = {}
+
     def __init__(self, templates_dir: Optional[str] = None):
         self.templates_dir = templates_dir or os.path.join(
             os.path.dirname(os.path.dirname(__file__)), "templates"
         )
+        self._has_template = JINJA2_AVAILABLE and os.path.exists(
+            os.path.join(self.templates_dir, 'report.html')
+        )
+
+    def generate_batch(
+        self,
+        reports: List[EvaluationReport],
+        out_dir: str,
+        formats: Sequence[str] = ("html", "json")
+    ) -> List[List[str]]:
+        """
+        Generate reports for many configs, rendering them in parallel.
+
+        Each report is independent, so reports are spread over a process
+        pool; a single report is rendered in-process. Files are named
+        report_<config name>.<format>, with a numeric suffix when two
+        configs share a name.
+
+        Args:
+            reports: Evaluation reports to render.
+            out_dir: Directory to write the report files into.
+            formats: Output formats ("html", "json", "pdf").
+
+        Returns:
+            Generated file paths per report, in input order.
+
+        Raises:
+            ValueError: If an unsupported format is requested.
+        """
+        unknown = [fmt for fmt in formats if fmt not in _FORMAT_METHODS]
+        if unknown:
+            raise ValueError(f"Unsupported report format(s): {', '.join(unknown)}")
+
+        # Assign unique output names up front, in input order
+        seen = {}
+        jobs = []
+        for report in reports:
+            stem = os.path.splitext(report.config_input.filename)[0] or "config"
+            n = seen.get(stem, 0)
+            seen[stem] = n + 1
+            name = f"report_{stem}" if n == 0 else f"report_{stem}_{n}"
+            jobs.append([(fmt, os.path.join(out_dir, f"{name}.{fmt}")) for fmt in formats])
+
+        if len(reports) <= 1:
+            return [
+                _render_one(self.templates_dir, report, outputs)
+                for report, outputs in zip(reports, jobs)
+            ]
+
+        max_workers = min(os.cpu_count() or 1, len(reports))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(_render_one, self.templates_dir, report, outputs)
+                for report, outputs in zip(reports, jobs)
+            ]
+            return [future.result() for future in futures]
 
     def generate_html(
         self,
@@ -42,11 +284,43 @@ class ReportGenerator:
         Returns:
             Path to the generated HTML file.
         """
+        self._ensure_output_dir(output_path)
+        # Stream rendered chunks through a large write buffer
+        with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.writelines(self._iter_html(report))
+
+        return output_path
+
+    def generate_pdf(
+        self,
+        report: EvaluationReport,
+        output_path: str
+    ) -> str:
+        """
+        Generate a PDF compliance report.
+
+        The rendered HTML is handed to WeasyPrint as a string, so no
+        intermediate HTML file is written or re-parsed from disk.
+
+        Args:
+            report: Complete evaluation report data.
+            output_path: Path to write the PDF file.
+
+        Returns:
+            Path to the generated PDF file.
+
+        Raises:
+            RuntimeError: If WeasyPrint is not installed.
+        """
+        try:
+            from weasyprint import HTML  # pyre-ignore
+        except ImportError:
+            raise RuntimeError("PDF output requires WeasyPrint (pip install weasyprint)")
+
         html_content = self._render_html(report)
 
-        os.makedirs(os.path.dirname(output_path) if os.path.dirname(output_path) else '.', exist_ok=True)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        self._ensure_output_dir(output_path)
+        HTML(string=html_content, base_url=self.templates_dir).write_pdf(output_path)
 
         return output_path
 
@@ -58,213 +332,139 @@ class ReportGenerator:
         """Generate a JSON results file for programmatic use."""
         data = self._report_to_dict(report)
 
-        os.makedirs(os.path.dirname(output_path) if os.path.dirname(output_path) else '.', exist_ok=True)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, default=str)
+        self._ensure_output_dir(output_path)
+        if ORJSON_AVAILABLE:
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(
+                    data,
+                    default=_json_default,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                ))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, default=_json_default)
 
         return output_path
 
+    @staticmethod
+    def _ensure_output_dir(output_path: str) -> None:
+        """Create the output file's directory if it does not exist."""
+        d = os.path.dirname(output_path)
+        if d:
+            os.makedirs(d, exist_ok=True)
+
     def _render_html(self, report: EvaluationReport) -> str:
         """Render the HTML report using Jinja2 or built-in template."""
-        if JINJA2_AVAILABLE and os.path.exists(os.path.join(self.templates_dir, 'report.html')):
-            env = Environment(loader=FileSystemLoader(self.templates_dir))
-            template = env.get_template('report.html')
-            return template.render(report=report, **self._template_context(report))
+        return ''.join(self._iter_html(report))
+
+    def _iter_html(self, report: EvaluationReport) -> Iterator[str]:
+        """Yield the HTML report in chunks using Jinja2 or built-in template."""
+        if self._has_template:
+            template = self._get_template('report.html')
+            return template.generate(report=report, **self._template_context(report))
         else:
-            return self._render_builtin_html(report)
+            return self._iter_builtin_html(report)
+
+    def _get_template(self, name: str):
+        """Return a compiled template, building the Environment only once per directory."""
+        cls = type(self)
+        key = (self.templates_dir, name)
+        template = cls._template_cache.get(key)
+        if template is None:
+            env = cls._env_cache.get(self.templates_dir)
+            if env is None:
+                env = Environment(
+                    loader=FileSystemLoader(self.templates_dir),
+                    autoescape=select_autoescape(['html']),
+                    bytecode_cache=_bytecode_cache(),
+                    auto_reload=False,
+                    cache_size=400,
+                    trim_blocks=True,
+                    lstrip_blocks=True,
+                )
+                env.globals["STATUS_CLASS"] = _STATUS_CLASS
+                cls._env_cache[self.templates_dir] = env
+            template = env.get_template(name)
+            cls._template_cache[key] = template
+        return template
 
     def _template_context(self, report: EvaluationReport) -> dict:
         """Build template context from report data."""
-        # Group failed controls by severity
-        failed_high = [cr for cr in report.classified_results
-                      if cr.status_label == "FAIL" and cr.severity_label == "high"]
-        failed_medium = [cr for cr in report.classified_results
-                        if cr.status_label == "FAIL" and cr.severity_label == "medium"]
-        failed_low = [cr for cr in report.classified_results
-                     if cr.status_label == "FAIL" and cr.severity_label == "low"]
-        warnings = [cr for cr in report.classified_results
-                   if cr.status_label == "WARNING"]
-        passed = [cr for cr in report.classified_results
-                 if cr.status_label == "PASS"]
+        ctx = self._partition_results(report)
+        ctx.update(self._report_fields(report))
+        return ctx
+
+    @staticmethod
+    def _partition_results(report: EvaluationReport) -> dict:
+        """Group results into passed, warnings, and failed-by-severity lists."""
+        # Single pass over the results
+        failed_high, failed_medium, failed_low, warnings, passed = [], [], [], [], []
+        failed_by_severity = {
+            "high": failed_high.append,
+            "medium": failed_medium.append,
+            "low": failed_low.append,
+        }
+        for cr in report.classified_results:
+            status = cr.status_label
+            if status == "PASS":
+                passed.append(cr)
+            elif status == "WARNING":
+                warnings.append(cr)
+            elif status == "FAIL":
+                add = failed_by_severity.get(cr.severity_label)
+                if add is not None:
+                    add(cr)
 
         return {
-            "config": report.config_input,
-            "vendor": report.vendor_info,
-            "score": report.compliance_score,
             "failed_high": failed_high,
             "failed_medium": failed_medium,
             "failed_low": failed_low,
             "warnings": warnings,
             "passed": passed,
+        }
+
+    @staticmethod
+    def _report_fields(report: EvaluationReport) -> dict:
+        """Report-level context fields shared by the template and built-in renderers."""
+        return {
+            "config": report.config_input,
+            "vendor": report.vendor_info,
+            "score": report.compliance_score,
             "all_results": report.classified_results,
             "cross_mappings": report.cross_mappings,
+            "cross_rows": _flatten_cross_mappings(report.cross_mappings),
             "standards": report.standards_evaluated,
-            "timestamp": report.timestamp,
+            "timestamp": report.timestamp_iso,
             "version": report.engine_version,
+            # Header fields, derived once per report
+            "timestamp_date": report.timestamp_iso[:10],
+            "hash_short": report.config_input.file_hash_hex[:16],
+            "vendor_upper": report.vendor_info.vendor_name.upper(),
+            "standards_joined": ', '.join(report.standards_evaluated),
         }
 
     def _render_builtin_html(self, report: EvaluationReport) -> str:
         """Built-in HTML template (no Jinja2 dependency required)."""
-        ctx = self._template_context(report)
-        score = report.compliance_score
-
-        # Build per-standard rows
-        standard_rows = ""
-        for std_name, std_score in score.per_standard.items():
-            standard_rows += f"""
-            <tr>
-                <td>{std_name}</td>
-                <td>{std_score.total_rules}</td>
-                <td class="pass">{std_score.passed}</td>
-                <td class="warn">{std_score.warned}</td>
-                <td class="fail">{std_score.failed}</td>
-                <td><span class="badge" style="background:{std_score.risk_color}">{std_score.percentage}%</span></td>
-                <td><span class="risk-badge" style="background:{std_score.risk_color}">{std_score.risk_level}</span></td>
-            </tr>"""
-
-        # Build failed controls rows
-        failed_rows = ""
-        for cr in report.classified_results:
-            if cr.status_label not in ("FAIL", "WARNING"):
-                continue
-            r = cr.rule_result
-            severity_class = f"severity-{cr.severity_label}"
-            status_class = "fail" if cr.status_label == "FAIL" else "warn"
-            failed_rows += f"""
-            <tr class="{severity_class}">
-                <td><code>{r.rule.rule_id}</code></td>
-                <td>{r.rule.title}</td>
-                <td><span class="badge {status_class}">{cr.status_label}</span></td>
-                <td><span class="badge {severity_class}">{cr.severity_label.upper()}</span></td>
-                <td>{r.rule.standard}</td>
-                <td><code>{r.found_value if r.found_value else 'N/A'}</code></td>
-                <td><code>{r.expected_value if r.expected_value else 'N/A'}</code></td>
-            </tr>"""
-
-        # Build remediation rows
-        remediation_rows = ""
-        for cr in report.classified_results:
-            if cr.status_label not in ("FAIL", "WARNING"):
-                continue
-            r = cr.rule_result
-            cmd = r.rule.remediation_command if r.rule.remediation_command else "N/A"
-            remediation_rows += f"""
-            <tr>
-                <td><code>{r.rule.rule_id}</code></td>
-                <td><span class="badge severity-{cr.severity_label}">{cr.severity_label.upper()}</span></td>
-                <td>{r.rule.remediation_text}</td>
-                <td><pre><code>{cmd}</code></pre></td>
-            </tr>"""
-
-        # Build appendix rows (all rules)
-        appendix_rows = ""
-        for cr in report.classified_results:
-            r = cr.rule_result
-            status_class = "pass" if cr.status_label == "PASS" else ("fail" if cr.status_label == "FAIL" else "warn")
-            appendix_rows += f"""
-            <tr>
-                <td><code>{r.rule.rule_id}</code></td>
-                <td>{r.rule.title}</td>
-                <td>{r.rule.standard}</td>
-                <td><span class="badge {status_class}">{cr.status_label}</span></td>
-                <td>{cr.severity_label.upper()}</td>
-                <td>{cr.penalty}</td>
-            </tr>"""
+        return ''.join(self._iter_builtin_html(report))
 
-        # Cross-standard mapping rows
-        cross_rows: str = ""
-        for mapping in report.cross_mappings:
-            if isinstance(mapping, dict):
-                for m in mapping.get("mappings", []):
-                    cross_rows += f"""  # pyre-ignore
-                    <tr>
-                        <td>{mapping.get('canonical_control', '')}</td>
-                        <td>{mapping.get('description', '')}</td>
-                        <td>{m.get('standard', '')}</td>
-                        <td>{m.get('control_id', '')}</td>
-                        <td>{m.get('section', '')}</td>
-                    </tr>"""
-
-        # Severity bar chart (CSS-based)
-        sev = score.severity_distribution
-        max_sev = max(sev.values()) if sev.values() else 1
-        sev_bars = ""
-        for level, count in [("high", sev.get("high", 0)), ("medium", sev.get("medium", 0)), ("low", sev.get("low", 0))]:
-            width = (count / max_sev * 100) if max_sev > 0 else 0
-            sev_bars += f"""
-            <div class="bar-row">
-                <span class="bar-label">{level.upper()}</span>
-                <div class="bar-container">
-                    <div class="bar severity-{level}-bg" style="width:{width}%"></div>
-                </div>
-                <span class="bar-value">{count}</span>
-            </div>"""
+    def _iter_builtin_html(self, report: EvaluationReport) -> Iterator[str]:
+        """
+        Yield the built-in HTML report in document order.
 
-        html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>SmartISMS Compliance Report</title>
-    <style>
-        :root {{
-            --bg: #0f172a; --surface: #1e293b; --surface2: #334155;
-            --text: #e2e8f0; --text-muted: #94a3b8; --border: #475569;
-            --pass: #22c55e; --warn: #eab308; --fail: #ef4444;
-            --high: #ef4444; --medium: #f59e0b; --low: #3b82f6;
-            --accent: #6366f1;
-        }}
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{ font-family: 'Segoe UI', system-ui, -apple-system, sans-serif; background: var(--bg); color: var(--text); line-height: 1.6; padding: 2rem; }}
-        .container {{ max-width: 1200px; margin: 0 auto; }}
-        h1 {{ font-size: 2rem; margin-bottom: 0.5rem; background: linear-gradient(135deg, var(--accent), #a78bfa); -webkit-background-clip: text; -webkit-text-fill-color: transparent; }}
-        h2 {{ font-size: 1.4rem; margin: 2rem 0 1rem; padding-bottom: 0.5rem; border-bottom: 2px solid var(--accent); color: var(--accent); }}
-        h3 {{ font-size: 1.1rem; margin: 1.5rem 0 0.5rem; color: var(--text); }}
-        .header {{ background: var(--surface); border-radius: 12px; padding: 2rem; margin-bottom: 2rem; border: 1px solid var(--border); }}
-        .header-meta {{ display: flex; gap: 2rem; margin-top: 1rem; color: var(--text-muted); font-size: 0.9rem; flex-wrap: wrap; }}
-        .score-hero {{ display: flex; align-items: center; gap: 2rem; margin-top: 1.5rem; }}
-        .score-circle {{ width: 120px; height: 120px; border-radius: 50%; display: flex; align-items: center; justify-content: center; font-size: 2rem; font-weight: 700; border: 4px solid; }}
-        .risk-label {{ font-size: 1.2rem; font-weight: 600; padding: 0.4rem 1rem; border-radius: 8px; }}
-        .stats-grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(150px, 1fr)); gap: 1rem; margin-top: 1rem; }}
-        .stat-card {{ background: var(--surface2); border-radius: 8px; padding: 1rem; text-align: center; }}
-        .stat-card .value {{ font-size: 1.8rem; font-weight: 700; }}
-        .stat-card .label {{ color: var(--text-muted); font-size: 0.85rem; }}
-        .card {{ background: var(--surface); border-radius: 12px; padding: 1.5rem; margin-bottom: 1.5rem; border: 1px solid var(--border); overflow-x: auto; }}
-        table {{ width: 100%; border-collapse: collapse; font-size: 0.9rem; }}
-        th {{ background: var(--surface2); padding: 0.75rem; text-align: left; font-weight: 600; white-space: nowrap; }}
-        td {{ padding: 0.75rem; border-top: 1px solid var(--border); }}
-        tr:hover {{ background: rgba(99, 102, 241, 0.05); }}
-        .badge {{ padding: 0.2rem 0.6rem; border-radius: 4px; font-size: 0.8rem; font-weight: 600; display: inline-block; }}
-        .pass {{ color: var(--pass); }} .warn {{ color: var(--warn); }} .fail {{ color: var(--fail); }}
-        .badge.pass {{ background: rgba(34,197,94,0.15); }} .badge.warn {{ background: rgba(234,179,8,0.15); }} .badge.fail {{ background: rgba(239,68,68,0.15); }}
-        .severity-high {{ color: var(--high); }} .severity-medium {{ color: var(--medium); }} .severity-low {{ color: var(--low); }}
-        .badge.severity-high {{ background: rgba(239,68,68,0.15); }} .badge.severity-medium {{ background: rgba(245,158,11,0.15); }} .badge.severity-low {{ background: rgba(59,130,246,0.15); }}
-        .risk-badge {{ padding: 0.25rem 0.8rem; border-radius: 6px; font-size: 0.8rem; font-weight: 600; color: #fff; }}
-        code {{ background: var(--surface2); padding: 0.15rem 0.4rem; border-radius: 4px; font-size: 0.85rem; }}
-        pre {{ background: var(--surface2); padding: 0.75rem; border-radius: 6px; overflow-x: auto; margin: 0; }}
-        pre code {{ background: none; padding: 0; }}
-        .bar-row {{ display: flex; align-items: center; gap: 0.75rem; margin: 0.5rem 0; }}
-        .bar-label {{ width: 70px; font-weight: 600; font-size: 0.85rem; }}
-        .bar-container {{ flex: 1; height: 24px; background: var(--surface2); border-radius: 4px; overflow: hidden; }}
-        .bar {{ height: 100%; border-radius: 4px; transition: width 0.5s ease; }}
-        .severity-high-bg {{ background: var(--high); }} .severity-medium-bg {{ background: var(--medium); }} .severity-low-bg {{ background: var(--low); }}
-        .bar-value {{ width: 30px; text-align: right; font-weight: 600; font-size: 0.9rem; }}
-        .footer {{ text-align: center; color: var(--text-muted); font-size: 0.8rem; margin-top: 3rem; padding-top: 1rem; border-top: 1px solid var(--border); }}
-        @media print {{ body {{ background: #fff; color: #000; }} .card,.header {{ border: 1px solid #ddd; }} th {{ background: #f3f4f6; }} }}
-    </style>
-</head>
-<body>
-<div class="container">
+        Rows are produced one at a time so generate_html can stream them
+        to disk instead of holding the whole document in memory.
+        """
+        # Only the report-level fields are needed here; the result
+        # partitions are for templates
+        ctx = self._report_fields(report)
+        score = report.compliance_score
 
-    <!-- 1. Header & Executive Summary -->
-    <div class="header">
-        <h1>🛡️ SmartISMS Compliance Report</h1>
-        <div class="header-meta">
-            <span>📄 <strong>{report.config_input.filename}</strong></span>
-            <span>🏷️ Vendor: <strong>{report.vendor_info.vendor_name.upper()}</strong></span>
-            <span>📅 {report.timestamp[:10]}</span>
-            <span>🔒 SHA-256: <code>{report.config_input.file_hash[:16]}...</code></span>
-            <span>📏 Standards: <strong>{', '.join(report.standards_evaluated)}</strong></span>
+        yield _HTML_HEAD
+        yield f"""            <span>📄 <strong>{_e(report.config_input.filename)}</strong></span>
+            <span>🏷️ Vendor: <strong>{ctx["vendor_upper"]}</strong></span>
+            <span>📅 {ctx["timestamp_date"]}</span>
+            <span>🔒 {report.config_input.hash_algo.upper()}: <code>{ctx["hash_short"]}...</code></span>
+            <span>📏 Standards: <strong>{_e(ctx["standards_joined"])}</strong></span>
         </div>
 
         <div class="score-hero">
@@ -290,14 +490,41 @@ class ReportGenerator:
     <div class="card">
         <table>
             <thead><tr><th>Standard</th><th>Rules</th><th>Pass</th><th>Warn</th><th>Fail</th><th>Score</th><th>Risk</th></tr></thead>
-            <tbody>{standard_rows}</tbody>
+            <tbody>"""
+
+        # Build per-standard rows
+        for std_name, std_score in score.per_standard.items():
+            yield f"""
+            <tr>
+                <td>{_e(std_name)}</td>
+                <td>{std_score.total_rules}</td>
+                <td class="pass">{std_score.passed}</td>
+                <td class="warn">{std_score.warned}</td>
+                <td class="fail">{std_score.failed}</td>
+                <td><span class="badge" style="background:{std_score.risk_color}">{std_score.percentage}%</span></td>
+                <td><span class="risk-badge" style="background:{std_score.risk_color}">{std_score.risk_level}</span></td>
+            </tr>"""
+
+        yield """</tbody>
         </table>
     </div>
 
     <!-- 3. Severity Distribution -->
     <h2>📈 Severity Distribution (Failures & Warnings)</h2>
     <div class="card">
-        {sev_bars}
+        """
+
+        # Severity bar chart (CSS-based)
+        sev = score.severity_distribution
+        high, medium, low = sev.get("high", 0), sev.get("medium", 0), sev.get("low", 0)
+        inv = 100.0 / max(max(sev.values(), default=1), 1)
+        yield (
+            _BAR_FMT.format(level="HIGH", cls="high", w=high * inv, n=high)
+            + _BAR_FMT.format(level="MEDIUM", cls="medium", w=medium * inv, n=medium)
+            + _BAR_FMT.format(level="LOW", cls="low", w=low * inv, n=low)
+        )
+
+        yield """
     </div>
 
     <!-- 4. Failed Controls -->
@@ -305,7 +532,41 @@ class ReportGenerator:
     <div class="card">
         <table>
             <thead><tr><th>Rule ID</th><th>Title</th><th>Status</th><th>Severity</th><th>Standard</th><th>Found</th><th>Expected</th></tr></thead>
-            <tbody>{failed_rows if failed_rows else '<tr><td colspan="7" style="text-align:center;color:var(--pass)">✅ No failed controls!</td></tr>'}</tbody>
+            <tbody>"""
+
+        # Per-result row fields, built once and shared by the failed,
+        # remediation, and appendix row formats
+        rows = []
+        issue_rows = []
+        for cr in report.classified_results:
+            r = cr.rule_result
+            rule = r.rule
+            status = cr.status_label
+            severity = cr.severity_label
+            fields = {
+                "rule_id": _e(rule.rule_id),
+                "title": _e(rule.title),
+                "standard": _e(rule.standard),
+                "status": status,
+                "status_class": _STATUS_CLASS.get(status, "warn"),
+                "sev_class": _SEV_CLASS.get(severity) or f"severity-{severity}",
+                "sev_up": severity.upper(),
+                "penalty": cr.penalty,
+            }
+            rows.append(fields)
+            if status in ("FAIL", "WARNING"):
+                fields["found"] = _e(r.found_value) if r.found_value else 'N/A'
+                fields["expected"] = _e(r.expected_value) if r.expected_value else 'N/A'
+                fields["remediation"] = _e(rule.remediation_text)
+                fields["command"] = _e(rule.remediation_command) if rule.remediation_command else "N/A"
+                issue_rows.append(fields)
+
+        # Build failed controls rows
+        yield ''.join([_FAILED_ROW.format_map(fields) for fields in issue_rows])
+        if not issue_rows:
+            yield '<tr><td colspan="7" style="text-align:center;color:var(--pass)">✅ No failed controls!</td></tr>'
+
+        yield """</tbody>
         </table>
     </div>
 
@@ -314,7 +575,14 @@ class ReportGenerator:
     <div class="card">
         <table>
             <thead><tr><th>Rule ID</th><th>Severity</th><th>Remediation</th><th>Command</th></tr></thead>
-            <tbody>{remediation_rows if remediation_rows else '<tr><td colspan="4" style="text-align:center;color:var(--pass)">✅ No remediation needed!</td></tr>'}</tbody>
+            <tbody>"""
+
+        # Build remediation rows
+        yield ''.join([_REMEDIATION_ROW.format_map(fields) for fields in issue_rows])
+        if not issue_rows:
+            yield '<tr><td colspan="4" style="text-align:center;color:var(--pass)">✅ No remediation needed!</td></tr>'
+
+        yield """</tbody>
         </table>
     </div>
 
@@ -323,7 +591,17 @@ class ReportGenerator:
     <div class="card">
         <table>
             <thead><tr><th>Canonical Control</th><th>Description</th><th>Standard</th><th>Control ID</th><th>Section</th></tr></thead>
-            <tbody>{cross_rows if cross_rows else '<tr><td colspan="5" style="text-align:center;color:var(--text-muted)">No cross-standard mappings loaded.</td></tr>'}</tbody>
+            <tbody>"""
+
+        # Cross-standard mapping rows
+        cross_rows = ctx["cross_rows"]
+        yield ''.join([
+            _CROSS_ROW.format(*[_e(v) for v in row]) for row in cross_rows
+        ])
+        if not cross_rows:
+            yield '<tr><td colspan="5" style="text-align:center;color:var(--text-muted)">No cross-standard mappings loaded.</td></tr>'
+
+        yield """</tbody>
         </table>
     </div>
 
@@ -332,44 +610,49 @@ class ReportGenerator:
     <div class="card">
         <table>
             <thead><tr><th>Rule ID</th><th>Title</th><th>Standard</th><th>Status</th><th>Severity</th><th>Penalty</th></tr></thead>
-            <tbody>{appendix_rows}</tbody>
+            <tbody>"""
+
+        # Build appendix rows (all rules)
+        yield ''.join([_APPENDIX_ROW.format_map(fields) for fields in rows])
+
+        yield f"""</tbody>
         </table>
     </div>
 
     <div class="footer">
-        <p>Generated by SmartISMS v{report.engine_version} • {report.timestamp} • Deterministic Rule-Based Evaluation Engine</p>
+        <p>Generated by SmartISMS v{report.engine_version} • {report.timestamp_iso} • Deterministic Rule-Based Evaluation Engine</p>
     </div>
 
 </div>
 </body>
 </html>"""
 
-        return html
-
     def _report_to_dict(self, report: EvaluationReport) -> dict:
         """Convert an EvaluationReport to a JSON-serializable dictionary."""
-        results_list = []
-        for cr in report.classified_results:
-            r = cr.rule_result
-            results_list.append({
-                "rule_id": r.rule.rule_id,
-                "standard": r.rule.standard,
-                "control_id": r.rule.control_id,
-                "title": r.rule.title,
-                "vendor": r.rule.vendor,
-                "category": r.rule.category,
+        results_list = [
+            {
+                "rule_id": rule.rule_id,
+                "standard": rule.standard,
+                "control_id": rule.control_id,
+                "title": rule.title,
+                "vendor": rule.vendor,
+                "category": rule.category,
                 "severity": cr.severity_label,
-                "weight": r.rule.weight,
+                "weight": rule.weight,
                 "status": cr.status_label,
                 "penalty": cr.penalty,
                 "weighted_penalty": cr.weighted_penalty,
                 "found_value": str(r.found_value) if r.found_value else None,
                 "expected_value": str(r.expected_value) if r.expected_value else None,
                 "reason": r.reason,
-                "remediation_text": r.rule.remediation_text,
-                "remediation_command": r.rule.remediation_command,
-                "cross_standard_refs": r.rule.cross_standard_refs,
-            })
+                "remediation_text": rule.remediation_text,
+                "remediation_command": rule.remediation_command,
+                "cross_standard_refs": rule.cross_standard_refs,
+            }
+            for cr in report.classified_results
+            for r in (cr.rule_result,)
+            for rule in (r.rule,)
+        ]
 
         per_standard = {}
         for std, ss in report.compliance_score.per_standard.items():
@@ -384,9 +667,10 @@ class ReportGenerator:
 
         return {
             "smartisms_version": report.engine_version,
-            "timestamp": report.timestamp,
+            "timestamp": report.timestamp_iso,
             "config_file": report.config_input.filename,
-            "config_hash": report.config_input.file_hash,
+            "config_hash": report.config_input.file_hash_hex,
+            "config_hash_algo": report.config_input.hash_algo,
             "vendor": report.vendor_info.vendor_name,
             "vendor_confidence": report.vendor_info.confidence,
             "standards_evaluated": report.standards_evaluated,
@@ -405,3 +689,16 @@ class ReportGenerator:
             "severity_distribution": report.compliance_score.severity_distribution,
             "results": results_list,
         }
+
+
+# Report format -> ReportGenerator method name
+_FORMAT_METHODS = {"html": "generate_html", "json": "generate_json", "pdf": "generate_pdf"}
+
+
+def _render_one(templates_dir: str, report: EvaluationReport, outputs: list) -> List[str]:
+    """Process-pool worker: write one report in each (format, path) pair."""
+    generator = ReportGenerator(templates_dir)
+    return [
+        getattr(generator, _FORMAT_METHODS[fmt])(report, path)
+        for fmt, path in outputs
+    ]
@@ -5,25 +5,83 @@ produces deterministic evaluation results.
 """
 
 import re
+import time
 import logging
-from typing import List, Optional
+from collections import OrderedDict
+from dataclasses import replace
+from functools import partial
+from operator import contains, eq, ge, gt, le, lt, ne
+from typing import TYPE_CHECKING, List, Optional
 from core.models import Rule, RuleCondition, RuleResult, NormalizedConfig  # pyre-ignore
 
+if TYPE_CHECKING:
+    from core.rule_repo_manager import RuleRepoManager  # pyre-ignore
+
 
 logger = logging.getLogger("smartisms.rule_engine")
 
 
+class _CachedConfigView:
+    """
+    Memoizing view over a NormalizedConfig for the duration of one scan.
+
+    Exposes the lookups the evaluators use (get, has_key, has_block) and
+    answers repeated queries for the same key from a local dict.
+    """
+
+    __slots__ = ("_config", "_values", "_blocks")
+
+    def __init__(self, config: NormalizedConfig):
+        self._config = config
+        self._values: dict = {}
+        self._blocks: dict = {}
+
+    def get(self, key: str, default=None):
+        values = self._values
+        if key in values:
+            value = values[key]
+        else:
+            value = values[key] = self._config.get(key)
+        return default if value is None else value
+
+    def has_key(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def has_block(self, block_name: str) -> bool:
+        blocks = self._blocks
+        if block_name in blocks:
+            return blocks[block_name]
+        exists = blocks[block_name] = self._config.has_block(block_name)
+        return exists
+
+
 class RuleEngine:
     """
     Core rule evaluation engine.
     Deterministic: same input + same rules = identical output.
     """
 
+    # Distinct config contents whose results are kept for reuse
+    RESULT_CACHE_SIZE = 8
+
+    def __init__(self):
+        # config content_key -> {id(rule): (rule, result)}, least recently used first
+        self._result_cache: OrderedDict = OrderedDict()
+        # Condition type -> evaluator
+        self._dispatch = {
+            "key_value_match": self._eval_key_value,
+            "block_exists": self._eval_block_exists,
+            "regex_match": self._eval_regex,
+            "negation": self._eval_negation,
+            "compound": self._eval_compound,
+        }
+
     def evaluate(
         self,
         config: NormalizedConfig,
         rules: List[Rule],
-        standards: Optional[List[str]] = None
+        standards: Optional[List[str]] = None,
+        repo: Optional["RuleRepoManager"] = None
     ) -> List[RuleResult]:
         """
         Evaluate all applicable rules against a normalized config.
@@ -32,23 +90,53 @@ class RuleEngine:
             config: Normalized configuration to evaluate.
             rules: List of all loaded rules.
             standards: Optional filter — only evaluate rules for these standards.
+            repo: Optional repository the rules were loaded from; when given,
+                applicable rules come from its (vendor, standard) index
+                instead of a scan over ``rules``.
 
         Returns:
             Sorted list of RuleResult objects (sorted by rule_id for determinism).
         """
-        # Filter rules by vendor and optionally by standard
-        applicable_rules = self._filter_rules(rules, config.vendor, standards)
-
-        # Sort by rule_id for deterministic ordering
-        applicable_rules.sort(key=lambda r: r.rule_id)
-
+        if repo is not None:
+            # Indexed lookup, already sorted by rule_id
+            applicable_rules = repo.get_filtered(config.vendor, standards)
+        else:
+            # Filter rules by vendor and optionally by standard
+            applicable_rules = self._filter_rules(rules, config.vendor, standards)
+
+            # Sort by rule_id for deterministic ordering
+            applicable_rules.sort(key=lambda r: r.rule_id)
+
+        # Rules already evaluated against identical config content (e.g. a
+        # rescan with another standards filter) reuse the earlier result
+        memo = self._results_for(config)
+        # Rules share keys heavily; look each one up once per scan
+        view = _CachedConfigView(config)
+        now = time.time()
         results = []
         for rule in applicable_rules:
-            result = self._evaluate_single_rule(rule, config)
+            cached = memo.get(id(rule))
+            if cached is not None and cached[0] is rule:
+                result = replace(cached[1], timestamp=now)
+            else:
+                result = self._evaluate_single_rule(rule, view)
+                memo[id(rule)] = (rule, result)
             results.append(result)
 
         return results
 
+    def _results_for(self, config: NormalizedConfig) -> dict:
+        """Return the memo of rule results for this config's content."""
+        key = config.content_key
+        memo = self._result_cache.get(key)
+        if memo is None:
+            memo = self._result_cache[key] = {}
+            if len(self._result_cache) > self.RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+        else:
+            self._result_cache.move_to_end(key)
+        return memo
+
     def _filter_rules(
         self,
         rules: List[Rule],
@@ -56,19 +144,13 @@ class RuleEngine:
         standards: Optional[List[str]]
     ) -> List[Rule]:
         """Filter rules by vendor and optional standard list."""
-        std_filter: List[str] = []
-        if standards is not None:
-            std_filter = [s.upper() for s in standards]
-        filtered: List[Rule] = []
-        for rule in rules:
-            # Vendor must match
-            if rule.vendor.lower() != vendor.lower():
-                continue
-            # Standard filter (if provided)
-            if len(std_filter) > 0:
-                if rule.standard.upper() not in std_filter:
-                    continue
-            filtered.append(rule)
+        vendor_lower = vendor.lower()
+        # Vendor must match
+        filtered = [rule for rule in rules if rule.vendor_norm == vendor_lower]
+        # Standard filter (if provided)
+        if standards:
+            std_filter = frozenset(s.upper() for s in standards)
+            filtered = [rule for rule in filtered if rule.standard_norm in std_filter]
         return filtered
 
     def _evaluate_single_rule(self, rule: Rule, config: NormalizedConfig) -> RuleResult:
@@ -95,30 +177,20 @@ class RuleEngine:
         config: NormalizedConfig
     ) -> RuleResult:
         """Evaluate a single condition against the config."""
-
-        if condition.type == "key_value_match":
-            return self._eval_key_value(rule, condition, config)
-        elif condition.type == "block_exists":
-            return self._eval_block_exists(rule, condition, config)
-        elif condition.type == "regex_match":
-            return self._eval_regex(rule, condition, config)
-        elif condition.type == "negation":
-            return self._eval_negation(rule, condition, config)
-        elif condition.type == "compound":
-            return self._eval_compound(rule, condition, config)
-        else:
+        handler = self._dispatch.get(condition.type)
+        if handler is None:
             return RuleResult(
                 rule=rule,
                 status="ERROR",
                 reason=f"Unknown condition type: {condition.type}"
             )
+        return handler(rule, condition, config)
 
     def _eval_key_value(
         self, rule: Rule, cond: RuleCondition, config: NormalizedConfig
     ) -> RuleResult:
         """Evaluate key_value_match condition."""
-        key = cond.key.lower().strip()
-        actual = config.get(key)
+        actual = config.get(cond.key_norm)
 
         if actual is None:
             return RuleResult(
@@ -129,10 +201,18 @@ class RuleEngine:
                 reason=f"Key '{cond.key}' not found in configuration"
             )
 
-        expected = str(cond.expected_value).lower().strip()
+        expected = cond.expected_norm
         actual_str = str(actual).lower().strip()
 
-        match = self._compare(actual_str, cond.operator, expected)
+        compare = cond.compare_fn
+        if compare is not None:
+            # Specialized for the operator at load time
+            match = compare(actual_str, cond.compare_arg)
+        elif cond.operator == "regex":
+            # Compiled once when the condition was built
+            match = cond.pattern is not None and cond.pattern.search(actual_str) is not None
+        else:
+            match = self._compare(actual_str, cond.operator, expected)
 
         return RuleResult(
             rule=rule,
@@ -146,8 +226,7 @@ class RuleEngine:
         self, rule: Rule, cond: RuleCondition, config: NormalizedConfig
     ) -> RuleResult:
         """Evaluate block_exists condition."""
-        block_name = cond.key.lower().strip()
-        exists = config.has_block(block_name)
+        exists = config.has_block(cond.key_norm)
 
         if cond.operator == "exists":
             passed = exists
@@ -168,7 +247,7 @@ class RuleEngine:
         self, rule: Rule, cond: RuleCondition, config: NormalizedConfig
     ) -> RuleResult:
         """Evaluate regex_match condition."""
-        actual = config.get(cond.key.lower())
+        actual = config.get(cond.key_norm)
 
         if actual is None:
             return RuleResult(
@@ -179,15 +258,15 @@ class RuleEngine:
                 reason=f"Key '{cond.key}' not found in configuration"
             )
 
-        try:
-            pattern = re.compile(str(cond.expected_value), re.IGNORECASE)
-            match = pattern.search(str(actual))
-        except re.error as e:
+        # Compiled once when the condition was built
+        pattern = cond.pattern
+        if pattern is None:
             return RuleResult(
                 rule=rule,
                 status="ERROR",
-                reason=f"Invalid regex pattern: {e}"
+                reason=f"Invalid regex pattern: {cond.pattern_error}"
             )
+        match = pattern.search(str(actual))
 
         return RuleResult(
             rule=rule,
@@ -201,11 +280,10 @@ class RuleEngine:
         self, rule: Rule, cond: RuleCondition, config: NormalizedConfig
     ) -> RuleResult:
         """Evaluate negation condition (key must NOT exist or must have negated form)."""
-        key = cond.key.lower().strip()
+        key = cond.key_norm
 
         # Check if the 'no <key>' form exists
-        negated_key = f"no {key}"
-        negated_exists = config.has_key(negated_key)
+        negated_exists = config.has_key(cond.negated_key_norm)
 
         # Check if the positive key exists
         positive_exists = config.has_key(key)
@@ -237,18 +315,20 @@ class RuleEngine:
                 reason="Compound condition has no sub-conditions"
             )
 
+        # Stop at the first sub-result that decides the outcome: a FAIL
+        # for AND, a PASS for OR
+        is_and = cond.logical_operator.upper() == "AND"
+        decisive = "FAIL" if is_and else "PASS"
         sub_results = []
-        for sub_cond_data in cond.sub_conditions:
-            if isinstance(sub_cond_data, RuleCondition):
-                sub_cond = sub_cond_data
-            else:
-                sub_cond = RuleCondition(**sub_cond_data)
+        for sub_cond in cond.sub_conditions:
             sub_result = self._evaluate_condition(rule, sub_cond, config)
             sub_results.append(sub_result)
+            if sub_result.status == decisive:
+                break
 
         statuses = [r.status for r in sub_results]
 
-        if cond.logical_operator.upper() == "AND":
+        if is_and:
             if all(s == "PASS" for s in statuses):
                 status = "PASS"
             elif any(s == "FAIL" for s in statuses):
@@ -263,6 +343,10 @@ class RuleEngine:
             else:
                 status = "WARNING"
 
+        if status == "PASS":
+            # Like the other evaluators, a pass carries no explanation
+            return RuleResult(rule=rule, status=status)
+
         # Collect sub-result details
         details = [
             f"[{r.status}] {r.rule.condition.key if hasattr(r, 'rule') else 'sub'}: {r.reason}"
@@ -280,43 +364,118 @@ class RuleEngine:
         Compare actual vs expected value using the given operator.
         All comparisons are case-insensitive.
         """
-        if operator == "equals":
-            return actual == expected
-        elif operator == "not_equals":
-            return actual != expected
-        elif operator == "contains":
-            return expected in actual
-        elif operator == "not_contains":
-            return expected not in actual
-        elif operator == "gte":
-            try:
-                return float(actual) >= float(expected)
-            except ValueError:
-                return False
-        elif operator == "lte":
-            try:
-                return float(actual) <= float(expected)
-            except ValueError:
-                return False
-        elif operator == "gt":
-            try:
-                return float(actual) > float(expected)
-            except ValueError:
-                return False
-        elif operator == "lt":
-            try:
-                return float(actual) < float(expected)
-            except ValueError:
-                return False
-        elif operator == "exists":
-            return actual is not None
-        elif operator == "not_exists":
-            return actual is None
-        elif operator == "regex":
-            try:
-                return bool(re.search(expected, actual, re.IGNORECASE))
-            except re.error:
-                return False
-        else:
+        compare = _OP_TABLE.get(operator)
+        if compare is None:
             logger.warning(f"Unknown operator '{operator}', defaulting to equals")
             return actual == expected
+        return compare(actual, expected)
+
+
+# Comparators are module-level functions (or partials of them) so that
+# conditions holding them stay picklable for process-pool reporting
+
+def _numeric(op, actual: str, expected: str) -> bool:
+    """Numeric comparison; non-numeric operands compare as False."""
+    try:
+        return op(float(actual), float(expected))
+    except ValueError:
+        return False
+
+
+def _not_contains(actual: str, expected: str) -> bool:
+    return expected not in actual
+
+
+def _exists(actual, expected) -> bool:
+    return actual is not None
+
+
+def _not_exists(actual, expected) -> bool:
+    return actual is None
+
+
+def _regex_search(actual: str, expected: str) -> bool:
+    try:
+        return bool(re.search(expected, actual, re.IGNORECASE))
+    except re.error:
+        return False
+
+
+# Operator name -> comparison(actual, expected)
+_OP_TABLE = {
+    "equals": eq,
+    "not_equals": ne,
+    "contains": contains,
+    "not_contains": _not_contains,
+    "gte": partial(_numeric, ge),
+    "lte": partial(_numeric, le),
+    "gt": partial(_numeric, gt),
+    "lt": partial(_numeric, lt),
+    "exists": _exists,
+    "not_exists": _not_exists,
+    "regex": _regex_search,
+}
+
+
+def _numeric_prepared(op, actual: str, expected: float) -> bool:
+    """Numeric comparison against an expected value already converted to float."""
+    try:
+        return op(float(actual), expected)
+    except ValueError:
+        return False
+
+
+def _pattern_search(actual: str, pattern: re.Pattern) -> bool:
+    return pattern.search(actual) is not None
+
+
+def _never(actual: str, expected) -> bool:
+    return False
+
+
+# Numeric operator -> comparison(actual, float expected)
+_NUMERIC_PREPARED = {
+    "gte": partial(_numeric_prepared, ge),
+    "lte": partial(_numeric_prepared, le),
+    "gt": partial(_numeric_prepared, gt),
+    "lt": partial(_numeric_prepared, lt),
+}
+
+
+def prepare_condition(cond: RuleCondition) -> RuleCondition:
+    """
+    Bind the comparison for a condition's operator ahead of evaluation.
+
+    Sets ``cond.compare_fn``/``cond.compare_arg`` so key_value_match
+    evaluation makes one call instead of dispatching on the operator name:
+    numeric operators get the expected value pre-converted to float, and
+    "regex" gets the compiled pattern. Unknown operators are left unbound
+    and keep the logged equals fallback in RuleEngine._compare.
+
+    Args:
+        cond: Condition to prepare (modified in place).
+
+    Returns:
+        The same condition, for chaining.
+    """
+    operator = cond.operator
+    if operator == "regex":
+        # An invalid pattern never matches, as in _compare
+        if cond.pattern is not None:
+            compare, arg = _pattern_search, cond.pattern
+        else:
+            compare, arg = _never, None
+    elif operator in _NUMERIC_PREPARED:
+        try:
+            compare, arg = _NUMERIC_PREPARED[operator], float(cond.expected_norm)
+        except ValueError:
+            # Non-numeric expected value: the comparison can never succeed
+            compare, arg = _never, None
+    else:
+        compare, arg = _OP_TABLE.get(operator), cond.expected_norm
+        if compare is None:
+            return cond
+
+    object.__setattr__(cond, "compare_fn", compare)
+    object.__setattr__(cond, "compare_arg", arg)
+    return cond
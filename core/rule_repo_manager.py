@@ -4,14 +4,60 @@ Loads, validates, indexes, and manages rule definition JSON files.
 """
 
 import os
+import sys
 import json
+import bisect
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from operator import attrgetter
 from typing import List, Optional
 from core.models import Rule, RuleCondition  # pyre-ignore
+from core.rule_engine import prepare_condition  # pyre-ignore
+
+try:
+    import orjson  # pyre-ignore
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 
 logger = logging.getLogger("smartisms.rule_repo")
 
+_RULE_ID = attrgetter("rule_id")
+
+
+def _read_json(filepath: str):
+    """Read and decode a JSON file, with orjson when available."""
+    with open(filepath, 'rb') as f:
+        raw = f.read()
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# Allowed values for the enumerated rule fields
+_SEVERITIES = frozenset({"high", "medium", "low"})
+_CONDITION_TYPES = frozenset({
+    "key_value_match", "block_exists", "regex_match", "negation", "compound"
+})
+
+
+def _condition_cost(cond: RuleCondition) -> int:
+    """Rough relative evaluation cost of a condition."""
+    if cond.type == "compound":
+        return 2
+    if cond.type == "regex_match" or cond.operator == "regex":
+        return 1
+    return 0
+
+
+def _pattern_errors(cond: RuleCondition) -> List[str]:
+    """Regex compile errors of a condition and, recursively, its sub-conditions."""
+    errors = [cond.pattern_error] if cond.pattern_error else []
+    for sub_cond in cond.sub_conditions:
+        errors.extend(_pattern_errors(sub_cond))
+    return errors
+
 
 class RuleRepoManager:
     """Manages the rule repository: loading, validation, filtering, indexing."""
@@ -28,6 +74,8 @@ class RuleRepoManager:
         self._index_by_id: dict = {}
         self._index_by_vendor: dict = {}
         self._index_by_standard: dict = {}
+        # (vendor, standard) -> rules sorted by rule_id
+        self._index_by_vendor_standard: dict = {}
         self._cross_standard_map: list = []
 
     def load_all(self) -> List[Rule]:
@@ -41,13 +89,16 @@ class RuleRepoManager:
         self._index_by_id = {}
         self._index_by_vendor = {}
         self._index_by_standard = {}
+        self._index_by_vendor_standard = {}
 
         if not os.path.isdir(self.rules_dir):
             logger.warning(f"Rules directory not found: {self.rules_dir}")
             return []
 
         # Walk through all JSON files
+        rule_files = []
         for root, dirs, files in os.walk(self.rules_dir):
+            dirs.sort()
             for filename in sorted(files):
                 if not filename.endswith('.json'):
                     continue
@@ -55,17 +106,30 @@ class RuleRepoManager:
                     self._load_cross_standard_map(os.path.join(root, filename))
                     continue
 
-                filepath = os.path.join(root, filename)
-                self._load_rule_file(filepath)
+                rule_files.append(os.path.join(root, filename))
+
+        # Files are read and decoded concurrently; registration stays
+        # sequential in walk order so duplicate detection is deterministic
+        if rule_files:
+            max_workers = min(32, (os.cpu_count() or 4) * 4, len(rule_files))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(_read_json, path) for path in rule_files]
+            for filepath, future in zip(rule_files, futures):
+                self._load_rule_file(filepath, future)
 
         logger.info(f"Loaded {len(self._rules)} rules from {self.rules_dir}")
         return self._rules
 
-    def _load_rule_file(self, filepath: str):
-        """Load and validate a single rule JSON file."""
+    def _load_rule_file(self, filepath: str, pending: Optional[Future] = None):
+        """
+        Load and validate a single rule JSON file.
+
+        Args:
+            filepath: Path to the rule file.
+            pending: Optional future already reading/decoding the file.
+        """
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = pending.result() if pending is not None else _read_json(filepath)
 
             # File can contain a single rule (dict) or list of rules
             if isinstance(data, list):
@@ -85,38 +149,31 @@ class RuleRepoManager:
         """Parse a rule dictionary and register it."""
         try:
             rule = self._dict_to_rule(data)
-            if self._validate_rule(rule, filepath):
+            # Claim the id and detect duplicates in one probe
+            duplicate = self._index_by_id.setdefault(rule.rule_id, rule) is not rule
+            if self._validate_rule(rule, filepath, duplicate):
                 self._rules.append(rule)
                 self._index_rule(rule)
+            elif not duplicate:
+                # Invalid for another reason: release the id claimed above
+                del self._index_by_id[rule.rule_id]
         except (KeyError, TypeError) as e:
             logger.error(f"Invalid rule data in {filepath}: {e}")
 
     def _dict_to_rule(self, data: dict) -> Rule:
         """Convert a dictionary to a Rule object."""
-        # Parse condition
-        cond_data = data.get("condition", {})
-        sub_conditions = []
-        for sc in cond_data.get("sub_conditions", []):
-            sub_conditions.append(sc)  # Keep as dict for lazy parsing
-
-        condition = RuleCondition(
-            type=cond_data.get("type", "key_value_match"),
-            scope=cond_data.get("scope", "global"),
-            key=cond_data.get("key", ""),
-            operator=cond_data.get("operator", "equals"),
-            expected_value=cond_data.get("expected_value", ""),
-            sub_conditions=sub_conditions,
-            logical_operator=cond_data.get("logical_operator", "AND"),
-        )
+        condition = self._dict_to_condition(data.get("condition", {}))
 
+        # Standard, vendor, and category repeat across every rule and key the
+        # indexes and score breakdowns, so share one interned object each
         return Rule(
             rule_id=data["rule_id"],
-            standard=data["standard"],
+            standard=sys.intern(data["standard"]),
             control_id=data["control_id"],
             title=data.get("title", ""),
             description=data.get("description", ""),
-            vendor=data["vendor"],
-            category=data.get("category", "general"),
+            vendor=sys.intern(data["vendor"]),
+            category=sys.intern(data.get("category", "general")),
             severity=data.get("severity", "medium"),
             weight=int(data.get("weight", 3)),
             condition=condition,
@@ -126,26 +183,52 @@ class RuleRepoManager:
             metadata=data.get("metadata", {}),
         )
 
-    def _validate_rule(self, rule: Rule, filepath: str) -> bool:
-        """Validate a rule has all required fields and valid values."""
+    def _dict_to_condition(self, cond_data: dict) -> RuleCondition:
+        """Convert a condition dictionary, and its sub-conditions, to a RuleCondition."""
+        # Sub-conditions are parsed here rather than on every evaluation
+        sub_conditions = [
+            self._dict_to_condition(sc) for sc in cond_data.get("sub_conditions", [])
+        ]
+        # Cheap checks first so compound evaluation short-circuits early
+        sub_conditions.sort(key=_condition_cost)
+
+        return prepare_condition(RuleCondition(
+            type=cond_data.get("type", "key_value_match"),
+            scope=cond_data.get("scope", "global"),
+            key=cond_data.get("key", ""),
+            operator=cond_data.get("operator", "equals"),
+            expected_value=cond_data.get("expected_value", ""),
+            sub_conditions=sub_conditions,
+            logical_operator=cond_data.get("logical_operator", "AND"),
+        ))
+
+    def _validate_rule(self, rule: Rule, filepath: str, duplicate: bool = False) -> bool:
+        """
+        Validate a rule has all required fields and valid values.
+
+        Args:
+            rule: Parsed rule.
+            filepath: Source file, for the log message.
+            duplicate: Whether an earlier rule already uses this rule_id.
+        """
         errors = []
 
         if not rule.rule_id:
             errors.append("Missing rule_id")
-        if rule.rule_id in self._index_by_id:
+        if duplicate:
             errors.append(f"Duplicate rule_id: {rule.rule_id}")
         if not rule.standard:
             errors.append("Missing standard")
         if not rule.vendor:
             errors.append("Missing vendor")
-        if rule.severity not in ("high", "medium", "low"):
+        if rule.severity not in _SEVERITIES:
             errors.append(f"Invalid severity: {rule.severity}")
         if not (1 <= rule.weight <= 5):
             errors.append(f"Invalid weight: {rule.weight} (must be 1-5)")
-        if rule.condition.type not in (
-            "key_value_match", "block_exists", "regex_match", "negation", "compound"
-        ):
+        if rule.condition.type not in _CONDITION_TYPES:
             errors.append(f"Invalid condition type: {rule.condition.type}")
+        for pattern_error in _pattern_errors(rule.condition):
+            errors.append(f"Invalid regex pattern: {pattern_error}")
 
         if errors:
             logger.warning(f"Rule validation errors in {filepath}: {', '.join(errors)}")
@@ -153,24 +236,27 @@ class RuleRepoManager:
         return True
 
     def _index_rule(self, rule: Rule):
-        """Index a rule for fast lookup by ID, vendor, and standard."""
-        self._index_by_id[rule.rule_id] = rule
-
-        vendor = rule.vendor.lower()
+        """Index a rule for fast lookup by vendor and standard (ID is indexed on registration)."""
+        # Vendor lists are kept sorted by rule_id so evaluation needs no sort
+        vendor = rule.vendor_norm
         if vendor not in self._index_by_vendor:
             self._index_by_vendor[vendor] = []
-        self._index_by_vendor[vendor].append(rule)
+        bisect.insort(self._index_by_vendor[vendor], rule, key=_RULE_ID)
 
-        standard = rule.standard.upper()
+        standard = rule.standard_norm
         if standard not in self._index_by_standard:
             self._index_by_standard[standard] = []
         self._index_by_standard[standard].append(rule)
 
+        pair = (vendor, standard)
+        if pair not in self._index_by_vendor_standard:
+            self._index_by_vendor_standard[pair] = []
+        bisect.insort(self._index_by_vendor_standard[pair], rule, key=_RULE_ID)
+
     def _load_cross_standard_map(self, filepath: str):
         """Load the cross-standard mapping file."""
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _read_json(filepath)
             if isinstance(data, list):
                 self._cross_standard_map = data
             elif isinstance(data, dict) and "mappings" in data:
@@ -190,6 +276,34 @@ class RuleRepoManager:
     def get_by_standard(self, standard: str) -> List[Rule]:
         return self._index_by_standard.get(standard.upper(), [])
 
+    def get_filtered(self, vendor: str, standards: Optional[List[str]] = None) -> List[Rule]:
+        """
+        Return the rules for a vendor, optionally limited to some standards.
+
+        Served from the (vendor, standard) index, so the cost is proportional
+        to the result size rather than the whole repository.
+
+        Args:
+            vendor: Vendor name (case-insensitive).
+            standards: Optional standards filter (case-insensitive); None or
+                empty means all standards.
+
+        Returns:
+            Matching rules sorted by rule_id.
+        """
+        vendor = vendor.lower()
+        if not standards:
+            return list(self._index_by_vendor.get(vendor, []))
+
+        groups = [
+            self._index_by_vendor_standard[(vendor, std)]
+            for std in dict.fromkeys(s.upper() for s in standards)
+            if (vendor, std) in self._index_by_vendor_standard
+        ]
+        if len(groups) == 1:
+            return list(groups[0])
+        return sorted((rule for group in groups for rule in group), key=_RULE_ID)
+
     def get_all(self) -> List[Rule]:
         return self._rules.copy()
 
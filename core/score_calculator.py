@@ -4,8 +4,24 @@ Computes weighted compliance scores, risk levels,
 and per-standard breakdowns.
 """
 
-from typing import List, Tuple
-from core.models import ClassifiedResult, ComplianceScore, StandardScore  # pyre-ignore
+from bisect import bisect_right
+from collections import Counter
+from typing import List, Tuple, Union
+from core.models import (  # pyre-ignore
+    ClassifiedResult, ClassifiedBatch, ComplianceScore, StandardScore
+)
+
+
+# Status label -> counter slot (passed, warned, failed, errored)
+_STATUS_SLOT = {"PASS": 0, "WARNING": 1, "FAIL": 2, "ERROR": 3, "SKIPPED": 3}
+
+
+def _percentage(raw: float, maximum: float) -> float:
+    """Score percentage truncated to two decimals and clamped to [0, 100]."""
+    if maximum == 0:
+        return 100.0
+    pct = float(int((raw / maximum) * 10000)) / 100.0
+    return max(0.0, min(100.0, pct))
 
 
 class ScoreCalculator:
@@ -19,7 +35,15 @@ class ScoreCalculator:
         ( 0,  49, "Critical Risk", "#dc3545"),
     ]
 
-    def calculate(self, classified_results: List[ClassifiedResult]) -> ComplianceScore:
+    # Lower bounds of each band above the lowest, ascending, and the
+    # (label, color) for each band: bisect_right picks the band directly
+    _RISK_BOUNDS: List[int] = [lo for lo, _, _, _ in sorted(RISK_LEVELS)][1:]
+    _RISK_TABLE: List[Tuple[str, str]] = [(label, color) for _, _, label, color in sorted(RISK_LEVELS)]
+
+    def calculate(
+        self,
+        classified_results: Union[List[ClassifiedResult], ClassifiedBatch]
+    ) -> ComplianceScore:
         """
         Calculate overall and per-standard compliance scores.
 
@@ -30,7 +54,9 @@ class ScoreCalculator:
             percentage = (raw_score / max_score) × 100
 
         Args:
-            classified_results: List of classified evaluation results.
+            classified_results: Classified evaluation results, as a list or
+                a column-oriented ClassifiedBatch (scored without touching
+                the per-rule objects).
 
         Returns:
             ComplianceScore with overall and per-standard breakdowns.
@@ -42,41 +68,71 @@ class ScoreCalculator:
                 total_rules=0, passed=0, warned=0, failed=0, errored=0
             )
 
-        # Overall calculation
-        max_score = sum(cr.rule_result.rule.weight * 5 for cr in classified_results)
-        actual_penalty = sum(cr.weighted_penalty for cr in classified_results)
-        raw_score = max_score - actual_penalty
-
-        if max_score == 0:
-            percentage = 100.0
+        if isinstance(classified_results, ClassifiedBatch):
+            batch = classified_results
         else:
-            percentage = float(int((raw_score / max_score) * 10000)) / 100.0
-
-        # Clamp percentage
-        percentage = max(0.0, min(100.0, percentage))
+            batch = ClassifiedBatch.from_results(classified_results)
+
+        # Overall totals and status counts straight off the columns
+        # (sum and Counter both run in C)
+        max_score = sum(batch.max_scores)
+        actual_penalty = sum(batch.penalties)
+        status_counts = Counter(batch.statuses)
+        passed = status_counts["PASS"]
+        warned = status_counts["WARNING"]
+        failed = status_counts["FAIL"]
+        errored = status_counts["ERROR"] + status_counts["SKIPPED"]
+
+        # Single sweep over the columns: severity distribution and running
+        # per-standard / per-category totals
+        severity_dist = {"high": 0, "medium": 0, "low": 0}
+        # standard -> [max, penalty, total, passed, warned, failed, errored]
+        std_totals = {}
+        # category -> [max, penalty]
+        cat_totals = {}
+
+        # The loop body is plain interpreted arithmetic, so bound methods
+        # are hoisted into locals
+        std_get = std_totals.get
+        cat_get = cat_totals.get
+        slot_get = _STATUS_SLOT.get
+
+        for standard, category, status, severity, rule_max, penalty in zip(
+            batch.standards, batch.categories, batch.statuses,
+            batch.severities, batch.max_scores, batch.penalties
+        ):
+            std = std_get(standard)
+            if std is None:
+                std = std_totals[standard] = [0, 0, 0, 0, 0, 0, 0]
+            std[0] += rule_max
+            std[1] += penalty
+            std[2] += 1
+
+            cat = cat_get(category)
+            if cat is None:
+                cat = cat_totals[category] = [0, 0]
+            cat[0] += rule_max
+            cat[1] += penalty
+
+            slot = slot_get(status)
+            if slot is not None:
+                std[3 + slot] += 1
+                if slot == 1 or slot == 2:
+                    sev = severity.lower()
+                    if sev in severity_dist:
+                        severity_dist[sev] += 1
 
-        # Count statuses
-        passed = sum(1 for cr in classified_results if cr.status_label == "PASS")
-        warned = sum(1 for cr in classified_results if cr.status_label == "WARNING")
-        failed = sum(1 for cr in classified_results if cr.status_label == "FAIL")
-        errored = sum(1 for cr in classified_results if cr.status_label in ("ERROR", "SKIPPED"))
+        raw_score = max_score - actual_penalty
+        percentage = _percentage(raw_score, max_score)
 
         # Risk level
         risk_level, risk_color = self._get_risk_level(percentage)
 
-        # Severity distribution
-        severity_dist = {"high": 0, "medium": 0, "low": 0}
-        for cr in classified_results:
-            if cr.status_label in ("FAIL", "WARNING"):
-                sev = cr.severity_label.lower()
-                if sev in severity_dist:
-                    severity_dist[sev] += 1
-
         # Per-standard breakdown
-        per_standard = self._calculate_per_standard(classified_results)
+        per_standard = self._calculate_per_standard(std_totals)
 
         # Per-category breakdown
-        per_category = self._calculate_per_category(classified_results)
+        per_category = self._calculate_per_category(cat_totals)
 
         return ComplianceScore(
             raw_score=raw_score,
@@ -84,7 +140,7 @@ class ScoreCalculator:
             percentage=percentage,
             risk_level=risk_level,
             risk_color=risk_color,
-            total_rules=len(classified_results),
+            total_rules=len(batch),
             passed=passed,
             warned=warned,
             failed=failed,
@@ -94,23 +150,13 @@ class ScoreCalculator:
             severity_distribution=severity_dist
         )
 
-    def _calculate_per_standard(self, results: List[ClassifiedResult]) -> dict:
-        """Calculate compliance scores per standard."""
-        # Group by standard
-        by_standard = {}
-        for cr in results:
-            std = cr.rule_result.rule.standard
-            if std not in by_standard:
-                by_standard[std] = []
-            by_standard[std].append(cr)
-
+    def _calculate_per_standard(self, std_totals: dict) -> dict:
+        """Build per-standard scores from the running totals gathered in calculate."""
         per_standard = {}
-        for standard, std_results in sorted(by_standard.items()):
-            max_s = sum(cr.rule_result.rule.weight * 5 for cr in std_results)
-            penalty_s = sum(cr.weighted_penalty for cr in std_results)
+        for standard, totals in sorted(std_totals.items()):
+            max_s, penalty_s, total, passed, warned, failed, errored = totals
             raw_s = max_s - penalty_s
-            pct_s = float(int((raw_s / max_s) * 10000)) / 100.0 if max_s > 0 else 100.0
-            pct_s = max(0.0, min(100.0, pct_s))
+            pct_s = _percentage(raw_s, max_s)
 
             risk_level, risk_color = self._get_risk_level(pct_s)
 
@@ -121,37 +167,22 @@ class ScoreCalculator:
                 percentage=pct_s,
                 risk_level=risk_level,
                 risk_color=risk_color,
-                total_rules=len(std_results),
-                passed=sum(1 for cr in std_results if cr.status_label == "PASS"),
-                warned=sum(1 for cr in std_results if cr.status_label == "WARNING"),
-                failed=sum(1 for cr in std_results if cr.status_label == "FAIL"),
-                errored=sum(1 for cr in std_results if cr.status_label in ("ERROR", "SKIPPED")),
+                total_rules=total,
+                passed=passed,
+                warned=warned,
+                failed=failed,
+                errored=errored,
             )
 
         return per_standard
 
-    def _calculate_per_category(self, results: List[ClassifiedResult]) -> dict:
-        """Calculate compliance percentages per category."""
-        by_category = {}
-        for cr in results:
-            cat = cr.rule_result.rule.category
-            if cat not in by_category:
-                by_category[cat] = []
-            by_category[cat].append(cr)
-
-        per_category = {}
-        for category, cat_results in sorted(by_category.items()):
-            max_c = sum(cr.rule_result.rule.weight * 5 for cr in cat_results)
-            penalty_c = sum(cr.weighted_penalty for cr in cat_results)
-            raw_c = max_c - penalty_c
-            pct_c = float(int((raw_c / max_c) * 10000)) / 100.0 if max_c > 0 else 100.0
-            per_category[category] = max(0.0, min(100.0, pct_c))
-
-        return per_category
+    def _calculate_per_category(self, cat_totals: dict) -> dict:
+        """Build per-category percentages from the running totals gathered in calculate."""
+        return {
+            category: _percentage(max_c - penalty_c, max_c)
+            for category, (max_c, penalty_c) in sorted(cat_totals.items())
+        }
 
     def _get_risk_level(self, percentage: float) -> Tuple[str, str]:
         """Determine risk level and color from percentage."""
-        for min_val, max_val, label, color in self.RISK_LEVELS:
-            if min_val <= percentage <= max_val:
-                return label, color
-        return "Critical Risk", "#dc3545"
+        return self._RISK_TABLE[bisect_right(self._RISK_BOUNDS, percentage)]
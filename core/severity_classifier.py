@@ -5,7 +5,30 @@ Assigns penalty values to rule results based on the penalty matrix
 """
 
 from typing import List
-from core.models import RuleResult, ClassifiedResult  # pyre-ignore
+from core.models import (  # pyre-ignore
+    RuleResult, ClassifiedResult, ClassifiedBatch, SEVERITY_CODES
+)
+
+
+# Result status -> small int code, used to index penalty tables
+STATUS_CODES = {"PASS": 0, "WARNING": 1, "FAIL": 2, "ERROR": 3, "SKIPPED": 4}
+
+# Code -> label, for mapping codes back to the classified labels
+_SEVERITY_LABELS = {code: label for label, code in SEVERITY_CODES.items()}
+
+# Penalty for unknown status/severity combinations
+_DEFAULT_PENALTY = -3
+
+
+def _penalty_table(matrix: dict) -> tuple:
+    """Lay out a (status, severity) -> penalty dict as a table indexed by codes."""
+    return tuple(
+        tuple(
+            matrix.get((status, severity), _DEFAULT_PENALTY)
+            for severity in sorted(SEVERITY_CODES, key=SEVERITY_CODES.get)
+        )
+        for status in sorted(STATUS_CODES, key=STATUS_CODES.get)
+    )
 
 
 class SeverityClassifier:
@@ -30,6 +53,9 @@ class SeverityClassifier:
         ("SKIPPED", "low"):     0,
     }
 
+    # PENALTY_MATRIX as _PENALTY_TABLE[status_code][severity_code]
+    _PENALTY_TABLE = _penalty_table(PENALTY_MATRIX)
+
     def classify(self, results: List[RuleResult]) -> List[ClassifiedResult]:
         """
         Apply penalty classification to all rule results.
@@ -41,17 +67,24 @@ class SeverityClassifier:
             List of ClassifiedResult with penalties applied.
         """
         classified = []
+        table = self._PENALTY_TABLE
 
         for result in results:
-            severity = result.rule.severity.lower()
-            status = result.status.upper()
-            weight = result.rule.weight
+            rule = result.rule
+            sev_code = rule.severity_code
+            severity = _SEVERITY_LABELS[sev_code] if sev_code is not None else rule.severity.lower()
+            status = result.status
+            status_code = STATUS_CODES.get(status)
+            if status_code is None:
+                status = status.upper()
+                status_code = STATUS_CODES.get(status)
+            weight = rule.weight
 
-            # Look up penalty from matrix
-            penalty = self.PENALTY_MATRIX.get(
-                (status, severity),
-                -3  # Default penalty for unknown combinations
-            )
+            # Look up penalty by (status, severity) code
+            if status_code is not None and sev_code is not None:
+                penalty = table[status_code][sev_code]
+            else:
+                penalty = _DEFAULT_PENALTY
 
             # Apply weight multiplier
             weighted_penalty = abs(penalty) * weight
@@ -66,9 +99,24 @@ class SeverityClassifier:
 
         return classified
 
+    def classify_batch(self, results: List[RuleResult]) -> ClassifiedBatch:
+        """
+        Classify results into a column-oriented batch for scoring.
+
+        Args:
+            results: List of raw rule evaluation results.
+
+        Returns:
+            ClassifiedBatch whose ``results`` matches classify(results).
+        """
+        batch = ClassifiedBatch()
+        for cr in self.classify(results):
+            batch.append(cr)
+        return batch
+
     def get_penalty(self, status: str, severity: str) -> int:
         """Get the raw penalty for a status-severity combination."""
         return self.PENALTY_MATRIX.get(
             (status.upper(), severity.lower()),
-            -3
+            _DEFAULT_PENALTY
         )
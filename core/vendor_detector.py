@@ -6,10 +6,36 @@ of a configuration file using signature pattern matching.
 
 import re
 import os
+import threading
+from collections import OrderedDict
+from dataclasses import replace
 from typing import Any, Dict, List, Tuple
 from core.models import ConfigInput, VendorInfo  # pyre-ignore
 
 
+def _compile_patterns(patterns: List[str], flags: int) -> List[Tuple["re.Pattern", str]]:
+    """Compile signature patterns, keeping each source string for reporting."""
+    return [(re.compile(pattern, flags), pattern) for pattern in patterns]
+
+
+def _fuse_patterns(patterns: List[str], flags: int) -> Tuple["re.Pattern", List[int]]:
+    """
+    Combine patterns into one alternation with a group per pattern.
+
+    Returns the compiled alternation and a table from group number to
+    pattern index. A pattern's own group encloses any groups inside it and
+    so closes last: a match's ``lastindex`` looks up the first pattern that
+    matched, and non-matching lines cost a single regex call.
+    """
+    fused = re.compile(
+        "|".join(f"(?P<p{i}>{pattern})" for i, pattern in enumerate(patterns)), flags
+    )
+    group_to_pattern = [-1] * (fused.groups + 1)
+    for name, group in fused.groupindex.items():
+        group_to_pattern[group] = int(name[1:])
+    return fused, group_to_pattern
+
+
 class VendorDetector:
     """Detects the vendor/platform of a configuration file."""
 
@@ -146,6 +172,31 @@ class VendorDetector:
         "firewall": [r"firewall", r"iptables", r"nftables", r"pf\.conf"],
     }
 
+    # Compiled once at import: (compiled, source) pairs per vendor
+    _CONTENT_PATTERNS: Dict[str, List[Tuple["re.Pattern", str]]] = {
+        vendor: _compile_patterns(sig_config["patterns"], re.IGNORECASE | re.MULTILINE)
+        for vendor, sig_config in VENDOR_SIGNATURES.items()
+    }
+    _FILENAME_PATTERNS: Dict[str, List[Tuple["re.Pattern", str]]] = {
+        vendor: _compile_patterns(hints, re.IGNORECASE)
+        for vendor, hints in FILENAME_HINTS.items()
+    }
+    _FUSED_PATTERNS: Dict[str, Tuple["re.Pattern", List[int]]] = {
+        vendor: _fuse_patterns(sig_config["patterns"], re.IGNORECASE | re.MULTILINE)
+        for vendor, sig_config in VENDOR_SIGNATURES.items()
+    }
+    # Most a vendor's content scan can add to its score: every pattern matched
+    _CONTENT_CEILINGS: Dict[str, float] = {
+        vendor: len(sig_config["patterns"]) * sig_config["weight"]
+        for vendor, sig_config in VENDOR_SIGNATURES.items()
+    }
+
+    # (hash_algo, file_hash, filename) -> VendorInfo, least recently used
+    # first; shared by all detectors
+    DETECT_CACHE_SIZE = 1024
+    _detect_cache: "OrderedDict[tuple, VendorInfo]" = OrderedDict()
+    _detect_lock = threading.Lock()
+
     def detect(self, config_input: ConfigInput) -> VendorInfo:
         """
         Detect the vendor/platform of a configuration file.
@@ -161,6 +212,25 @@ class VendorDetector:
         Returns:
             VendorInfo with detected vendor and confidence score.
         """
+        # Detection only looks at the filename and the content, which the
+        # file hash stands for, so reloading the same file skips the scan
+        key = (config_input.hash_algo, config_input.file_hash, config_input.filename)
+        cache = VendorDetector._detect_cache
+        with VendorDetector._detect_lock:
+            info = cache.get(key)
+            if info is not None:
+                cache.move_to_end(key)
+        if info is None:
+            info = self._detect(config_input)
+            with VendorDetector._detect_lock:
+                cache[key] = info
+                if len(cache) > self.DETECT_CACHE_SIZE:
+                    cache.popitem(last=False)
+        # Callers own the returned object, so hand out a copy
+        return replace(info, matched_patterns=list(info.matched_patterns))
+
+    def _detect(self, config_input: ConfigInput) -> VendorInfo:
+        """Run the extension, filename and content passes (uncached)."""
         scores: Dict[str, float] = {vendor: 0.0 for vendor in self.VENDOR_SIGNATURES}
         matched_patterns: List[str] = []
         detection_method: str = "signature"
@@ -178,31 +248,66 @@ class VendorDetector:
 
         # Pass 2: Filename hints
         filename_lower = config_input.filename.lower()
-        for vendor, hint_patterns in self.FILENAME_HINTS.items():
-            for pattern in hint_patterns:
-                if re.search(pattern, filename_lower, re.IGNORECASE):
+        for vendor, hint_patterns in self._FILENAME_PATTERNS.items():
+            for compiled, pattern in hint_patterns:
+                if compiled.search(filename_lower):
                     scores[vendor] += 2.0
                     matched_patterns.append(f"filename:{pattern}")
                     detection_method = "filename+signature"
 
-        # Pass 3: Content signature matching (first 200 lines)
-        lines = config_input.content.split('\n')[:200]
-        for vendor, sig_config in self.VENDOR_SIGNATURES.items():
-            vendor_patterns = sig_config["patterns"]
+        # Pass 3: Content signature matching (first 200 lines; maxsplit
+        # leaves the rest of a large file unsplit). Lines are stripped and
+        # blanks dropped once here, and the list is shared by every vendor.
+        lines = [
+            line_stripped
+            for line_stripped in map(str.strip, config_input.content.split('\n', 200)[:200])
+            if line_stripped
+        ]
+        content_matches: Dict[str, List[str]] = {vendor: [] for vendor in scores}
+        # Vendors with a filename hint are scanned first: they usually win,
+        # and a vendor that could not reach the leading score even if every
+        # one of its patterns matched is not scanned at all. It cannot win,
+        # and only the winner's patterns are reported.
+        leader = 0.0
+        for vendor in sorted(scores, key=lambda v: -scores[v]):
+            sig_config = self.VENDOR_SIGNATURES[vendor]
+            vendor_patterns = self._CONTENT_PATTERNS[vendor]
             vendor_weight = sig_config["weight"]
-            for pattern in vendor_patterns:
-                for line in lines:
-                    line_stripped = line.strip()
-                    if not line_stripped:
-                        continue
-                    if re.match(pattern, line_stripped, re.IGNORECASE | re.MULTILINE):
-                        scores[vendor] += vendor_weight
-                        matched_patterns.append(f"content:{pattern}")
-                        break  # One match per pattern is enough
-
-        # Find the best match
-        best_vendor: str = max(scores, key=lambda k: scores[k])
-        best_score: float = scores[best_vendor]
+            if scores[vendor] + self._CONTENT_CEILINGS[vendor] < leader:
+                continue
+            fused, group_to_pattern = self._FUSED_PATTERNS[vendor]
+            hit = [False] * len(vendor_patterns)
+            remaining = len(vendor_patterns)
+            for line_stripped in lines:
+                m = fused.match(line_stripped)
+                if m is None:
+                    continue
+                # The alternation reports the first pattern that matched;
+                # later patterns may match the same line as well
+                first = group_to_pattern[m.lastindex]
+                for i in range(first, len(vendor_patterns)):
+                    if not hit[i] and (i == first or vendor_patterns[i][0].match(line_stripped)):
+                        hit[i] = True
+                        remaining -= 1
+                if not remaining:
+                    break
+
+            # One match per pattern is enough; report in pattern order
+            for (_, pattern), matched in zip(vendor_patterns, hit):
+                if matched:
+                    scores[vendor] += vendor_weight
+                    content_matches[vendor].append(f"content:{pattern}")
+            leader = max(leader, scores[vendor])
+
+        for vendor in self.VENDOR_SIGNATURES:
+            matched_patterns.extend(content_matches[vendor])
+
+        # Find the best match in one pass (first vendor wins a tie, as with max)
+        best_vendor: str = "unknown"
+        best_score: float = -1.0
+        for vendor, score in scores.items():
+            if score > best_score:
+                best_vendor, best_score = vendor, score
         best_patterns: Any = self.VENDOR_SIGNATURES[best_vendor]["patterns"]
         total_patterns: int = len(best_patterns)
 
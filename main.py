@@ -8,15 +8,19 @@ security standards: ISO 27001, PCI-DSS, HIPAA, CIS Benchmarks.
 
 Usage:
     python main.py --config <file> [--standards ISO27001,PCI-DSS] [--output report.html]
-    python main.py --config-dir <directory> [--standards CIS] [--format html|json]
+    python main.py --config-dir <directory> [--standards CIS] [--format html|json|pdf]
 """
 
 import argparse
+import contextlib
+import io
 import os
 import sys
 import json
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from typing import List, Optional, Tuple
 
 from core.input_handler import InputHandler  # pyre-ignore
 from core.vendor_detector import VendorDetector  # pyre-ignore
@@ -51,7 +55,8 @@ def run_evaluation(
     output_path: str = None,  # pyre-ignore
     output_format: str = "html",
     rules_dir: str = None,  # pyre-ignore
-    verbose: bool = False
+    verbose: bool = False,
+    rule_repo: Optional[RuleRepoManager] = None
 ) -> EvaluationReport:
     """
     Run the full SmartISMS evaluation pipeline.
@@ -62,9 +67,10 @@ def run_evaluation(
         config_path: Path to the configuration file.
         standards: List of standards to evaluate (None = all).
         output_path: Path for the output report.
-        output_format: "html" or "json".
+        output_format: "html", "json", or "pdf".
         rules_dir: Path to rules directory.
         verbose: Enable verbose logging.
+        rule_repo: Already loaded rule repository (rules_dir is then unused).
     """
     logger = logging.getLogger("smartisms")
     project_root = get_project_root()
@@ -91,7 +97,7 @@ def run_evaluation(
     config_input = input_handler.load_file(config_path)
     print(f"  [FILE] {config_input.filename}")
     print(f"  [SIZE] {config_input.file_size} bytes")
-    print(f"  [HASH] SHA-256: {config_input.file_hash[:32]}...")
+    print(f"  [HASH] {config_input.hash_algo.upper()}: {config_input.file_hash_hex[:32]}...")
 
     # -- Step 2: Vendor Detection --
     logger.info("Step 2/7: Detecting vendor...")
@@ -117,24 +123,27 @@ def run_evaluation(
 
     # -- Step 5: Load Rules & Evaluate --
     logger.info("Step 5/7: Loading rules and evaluating...")
-    rule_repo = RuleRepoManager(rules_dir)
-    all_rules = rule_repo.load_all()
+    if rule_repo is None:
+        rule_repo = RuleRepoManager(rules_dir)
+        rule_repo.load_all()
+    all_rules = rule_repo.get_all()
     stats = rule_repo.get_stats()
     print(f"  [RULES] {stats['total_rules']} rules loaded")
     for std, count in stats.get('rules_per_standard', {}).items():
         print(f"          {std}: {count} rules")
 
     rule_engine = RuleEngine()
-    results = rule_engine.evaluate(normalized, all_rules, standards)
+    results = rule_engine.evaluate(normalized, all_rules, standards, repo=rule_repo)
     print(f"  [EVAL]  {len(results)} rules applied")
 
     # -- Step 6: Classify & Score --
     logger.info("Step 6/7: Classifying and scoring...")
     classifier = SeverityClassifier()
-    classified = classifier.classify(results)
+    batch = classifier.classify_batch(results)
+    classified = batch.results
 
     calculator = ScoreCalculator()
-    compliance_score = calculator.calculate(classified)
+    compliance_score = calculator.calculate(batch)
 
     print(f"\n  {'-'*40}")
     print(f"  COMPLIANCE SCORE: {compliance_score.percentage}%")
@@ -162,6 +171,8 @@ def run_evaluation(
     report_gen = ReportGenerator()
     if output_format == "json":
         report_gen.generate_json(report, output_path)
+    elif output_format == "pdf":
+        report_gen.generate_pdf(report, output_path)
     else:
         report_gen.generate_html(report, output_path)
 
@@ -173,6 +184,150 @@ def run_evaluation(
     return report
 
 
+# Rule repository loaded once by the parent and handed to each worker
+_worker_repo: Optional[RuleRepoManager] = None
+
+
+def _init_worker(rule_repo: RuleRepoManager, verbose: bool):
+    """Process pool initializer: install the shared rules and logging."""
+    global _worker_repo
+    _worker_repo = rule_repo
+    setup_logging(verbose)
+
+
+def _evaluate_one(
+    config_path: str,
+    standards: Optional[list],
+    output_path: str,
+    output_format: str,
+    rule_repo: Optional[RuleRepoManager] = None
+) -> Tuple[str, Optional[str]]:
+    """
+    Evaluate one file of a directory run, capturing its console output.
+
+    Returns:
+        (captured output, error message or None on success).
+    """
+    buffer = io.StringIO()
+    error = None
+    try:
+        with contextlib.redirect_stdout(buffer):
+            run_evaluation(
+                config_path=config_path,
+                standards=standards,
+                output_path=output_path,
+                output_format=output_format,
+                rule_repo=rule_repo or _worker_repo,
+            )
+    except SystemExit:
+        # run_evaluation has already printed why it stopped
+        error = "evaluation aborted"
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    return buffer.getvalue(), error
+
+
+def collect_config_files(dir_path: str) -> List[str]:
+    """
+    List the configuration files directly inside a directory.
+
+    Uses the same selection as InputHandler.load_directory: regular files
+    with a supported extension, sorted by name.
+    """
+    if not os.path.isdir(dir_path):
+        raise FileNotFoundError(f"Configuration directory not found: {dir_path}")
+    with os.scandir(dir_path) as it:
+        entries = sorted(it, key=lambda e: e.name)
+    return [
+        entry.path for entry in entries
+        if entry.is_file()
+        and os.path.splitext(entry.name)[1].lower() in InputHandler.SUPPORTED_EXTENSIONS
+    ]
+
+
+def run_directory_evaluation(
+    config_dir: str,
+    standards: list = None,  # pyre-ignore
+    output_dir: str = None,  # pyre-ignore
+    output_format: str = "html",
+    rules_dir: str = None,  # pyre-ignore
+    verbose: bool = False
+) -> List[Tuple[str, Optional[str]]]:
+    """
+    Evaluate every configuration file in a directory.
+
+    Files are independent, so they are evaluated in a process pool. Rules
+    are loaded once here and shared with the workers through the pool
+    initializer. Each file's console output is printed in file order once
+    it completes.
+
+    Args:
+        config_dir: Directory containing configuration files.
+        standards: List of standards to evaluate (None = all).
+        output_dir: Directory for the reports (default: output/).
+        output_format: "html", "json", or "pdf".
+        rules_dir: Path to rules directory.
+        verbose: Enable verbose logging.
+
+    Returns:
+        (config path, error message or None) for each file, in file order.
+    """
+    project_root = get_project_root()
+    config_paths = collect_config_files(config_dir)
+    if not config_paths:
+        raise ValueError(f"No configuration files found in: {config_dir}")
+
+    if not rules_dir:
+        rules_dir = os.path.join(project_root, "rules")
+    if not output_dir:
+        output_dir = os.path.join(project_root, "output")
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Report names are fixed up front so files sharing a stem don't collide
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    output_paths = []
+    used_names = set()
+    for config_path in config_paths:
+        stem = f"report_{os.path.splitext(os.path.basename(config_path))[0]}_{timestamp}"
+        name, n = stem, 1
+        while name in used_names:
+            n += 1
+            name = f"{stem}_{n}"
+        used_names.add(name)
+        output_paths.append(os.path.join(output_dir, f"{name}.{output_format}"))
+
+    rule_repo = RuleRepoManager(rules_dir)
+    rule_repo.load_all()
+
+    jobs = [
+        (config_path, standards, output_path, output_format)
+        for config_path, output_path in zip(config_paths, output_paths)
+    ]
+    if len(jobs) == 1:
+        outcomes = [_evaluate_one(*jobs[0], rule_repo=rule_repo)]
+        print(outcomes[0][0], end="")
+    else:
+        max_workers = min(os.cpu_count() or 1, len(jobs))
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(rule_repo, verbose),
+        ) as executor:
+            futures = [executor.submit(_evaluate_one, *job) for job in jobs]
+            outcomes = []
+            for future in futures:
+                outcome = future.result()
+                print(outcome[0], end="")
+                outcomes.append(outcome)
+
+    failures = [(path, error) for path, (_, error) in zip(config_paths, outcomes) if error]
+    print(f"  [DIR] {len(config_paths) - len(failures)}/{len(config_paths)} files evaluated")
+    for path, error in failures:
+        print(f"  [ERROR] {os.path.basename(path)}: {error}")
+
+    return [(path, error) for path, (_, error) in zip(config_paths, outcomes)]
+
+
 def main():
     """CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -185,14 +340,19 @@ Examples:
   python main.py --config myconfig.conf --standards ISO27001,PCI-DSS
   python main.py --config myconfig.conf --output report.html --format html
   python main.py --config myconfig.conf --format json --verbose
+  python main.py --config-dir configs/ --standards CIS --format json
         """
     )
 
-    parser.add_argument(
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument(
         "--config", "-c",
-        required=True,
         help="Path to the configuration file to evaluate"
     )
+    source.add_argument(
+        "--config-dir", "-d",
+        help="Directory of configuration files to evaluate in parallel"
+    )
     parser.add_argument(
         "--standards", "-s",
         default=None,
@@ -202,11 +362,12 @@ Examples:
     parser.add_argument(
         "--output", "-o",
         default=None,
-        help="Output file path (default: output/report_<name>_<timestamp>.<format>)"
+        help="Output file path, or output directory with --config-dir "
+             "(default: output/report_<name>_<timestamp>.<format>)"
     )
     parser.add_argument(
         "--format", "-f",
-        choices=["html", "json"],
+        choices=["html", "json", "pdf"],
         default="html",
         help="Output format (default: html)"
     )
@@ -231,14 +392,26 @@ Examples:
         standards = [s.strip() for s in args.standards.split(",")]
 
     try:
-        run_evaluation(
-            config_path=args.config,
-            standards=standards,  # pyre-ignore
-            output_path=args.output,
-            output_format=args.format,
-            rules_dir=args.rules_dir,
-            verbose=args.verbose,
-        )
+        if args.config_dir:
+            outcomes = run_directory_evaluation(
+                config_dir=args.config_dir,
+                standards=standards,  # pyre-ignore
+                output_dir=args.output,
+                output_format=args.format,
+                rules_dir=args.rules_dir,
+                verbose=args.verbose,
+            )
+            if any(error for _, error in outcomes):
+                sys.exit(1)
+        else:
+            run_evaluation(
+                config_path=args.config,
+                standards=standards,  # pyre-ignore
+                output_path=args.output,
+                output_format=args.format,
+                rules_dir=args.rules_dir,
+                verbose=args.verbose,
+            )
     except FileNotFoundError as e:
         print(f"\n  [ERROR] File Error: {e}")
         sys.exit(1)
@@ -3,52 +3,65 @@ Apache Configuration Parser
 Parses Apache httpd configuration files with XML-style directives.
 """
 
+import io
 import re
+import sys
 from core.models import ParsedConfig
 
 
+# Block tags: <VirtualHost *:80> ... </VirtualHost>
+_OPEN_RE = re.compile(r'^<(\w+)\s*(.*?)>')
+_CLOSE_RE = re.compile(r'^</(\w+)>')
+
+
 class ApacheParser:
     """Parser for Apache httpd configuration files."""
 
     def parse(self, content: str) -> ParsedConfig:
         """Parse Apache config into structured format."""
         config = ParsedConfig(vendor="apache")
-        lines = content.split('\n')
+        # Lines are streamed rather than split into a list up front
+        lines = io.StringIO(content)
 
-        block_stack = []   # Track nested <Directory>, <VirtualHost>, etc.
+        # Track nested <Directory>, <VirtualHost>, etc. Each entry is the
+        # full '::'-joined path of the block, extended on push and restored
+        # by pop, so directives never re-join the stack.
+        block_stack = []
 
         for line in lines:
             line = line.strip()
 
             # Skip empty lines and comments
-            if not line or line.startswith('#'):
+            if not line or line[0] == '#':
                 continue
 
-            # Opening XML-style block: <VirtualHost *:80>
-            open_match = re.match(r'^<(\w+)\s*(.*?)>', line)
-            close_match = re.match(r'^</(\w+)>', line)
-
-            if close_match:
-                # Closing block tag
-                if block_stack:
-                    block_stack.pop()
-                continue
-
-            if open_match:
-                tag_name = open_match.group(1)
-                tag_args = open_match.group(2).strip()
-                block_name = f"{tag_name} {tag_args}".strip() if tag_args else tag_name
-                block_stack.append(block_name)
-
-                full_block = '::'.join(block_stack)
-                config.blocks.append(full_block)
-                if full_block not in config.sections:
-                    config.sections[full_block] = {}
-                continue
+            # Only lines starting with '<' can be block tags; directives
+            # skip both tag regexes
+            if line[0] == '<':
+                # Closing block tag: </VirtualHost>
+                if _CLOSE_RE.match(line):
+                    if block_stack:
+                        block_stack.pop()
+                    continue
+
+                # Opening XML-style block: <VirtualHost *:80>
+                open_match = _OPEN_RE.match(line)
+                if open_match:
+                    tag_name = open_match.group(1)
+                    tag_args = open_match.group(2).strip()
+                    block_name = f"{tag_name} {tag_args}".strip() if tag_args else tag_name
+                    full_block = f"{block_stack[-1]}::{block_name}" if block_stack else block_name
+                    block_stack.append(full_block)
+
+                    config.blocks.append(full_block)
+                    if full_block not in config.sections:
+                        config.sections[full_block] = {}
+                    continue
 
             # Parse directive: Key Value
             parts = line.split(None, 1)
-            key = parts[0]
+            # Directive names recur across blocks; share one string each
+            key = sys.intern(parts[0])
             value = parts[1] if len(parts) > 1 else "On"
 
             # Remove surrounding quotes from value
@@ -56,15 +69,15 @@ class ApacheParser:
 
             # Build flat key with block context
             if block_stack:
-                current_block = '::'.join(block_stack)
-                flat_key = f"{current_block}::{key}"
+                current_section = block_stack[-1]
+                flat_key = f"{current_section}::{key}"
             else:
+                current_section = "global"
                 flat_key = key
 
             config.flat_keys[flat_key] = value
 
             # Store in sections
-            current_section = '::'.join(block_stack) if block_stack else "global"
             if current_section not in config.sections:
                 config.sections[current_section] = {}
             config.sections[current_section][key] = value
@@ -3,7 +3,9 @@ Cisco IOS Configuration Parser
 Parses Cisco IOS/IOS-XE style configuration files into structured format.
 """
 
+import io
 import re
+import sys
 from core.models import ParsedConfig
 
 
@@ -22,25 +24,28 @@ class CiscoParser:
     def parse(self, content: str) -> ParsedConfig:
         """Parse Cisco IOS config into structured format."""
         config = ParsedConfig(vendor="cisco")
-        lines = content.split('\n')
+        # Lines are streamed rather than split into a list up front
+        lines = io.StringIO(content)
 
         current_section = None
         current_block = {}
         section_stack = []
 
-        for line_num, raw_line in enumerate(lines):
+        for raw_line in lines:
             line = raw_line.rstrip()
 
-            # Skip comments and empty lines
-            if self._should_skip(line):
+            # Skip empty lines and comments with plain string checks; only
+            # the rarer banner lines and "end" need the skip regex
+            head = line.lstrip()
+            if not head or head[0] == '!':
+                continue
+            if line[0] in _SKIP_FIRST_CHARS and _SKIP_RE.match(line):
                 continue
 
-            # Detect section start (interface, router, line, etc.)
-            section_match = re.match(
-                r'^(interface|router|line|ip access-list|crypto|class-map|'
-                r'policy-map|route-map|vlan|spanning-tree|aaa|key chain)\s+(.*)',
-                line, re.IGNORECASE
-            )
+            # Detect section start (interface, router, line, etc.); indented
+            # sub-directives and other lines that can't start a section
+            # keyword skip the regex
+            section_match = _SECTION_RE.match(line) if line[0] in _SECTION_STARTS else None
 
             if section_match:
                 # Save previous section
@@ -65,6 +70,9 @@ class CiscoParser:
                 stripped = line.strip()
                 if stripped:
                     key, value = self._parse_kv(stripped)
+                    # The same sub-commands recur in every interface/router
+                    # block, so their block keys share one string each
+                    key = sys.intern(key)
                     current_block[key] = value
 
                     # Also store as section.key in flat_keys
@@ -85,10 +93,7 @@ class CiscoParser:
 
     def _should_skip(self, line: str) -> bool:
         """Check if line should be skipped."""
-        for pattern in self.SKIP_PATTERNS:
-            if re.match(pattern, line):
-                return True
-        return False
+        return _SKIP_RE.match(line) is not None
 
     def _parse_kv(self, line: str) -> tuple:
         """
@@ -122,3 +127,19 @@ class CiscoParser:
         if section_name.startswith('interface '):
             iface_name = section_name.replace('interface ', '')
             config.interfaces[iface_name] = block.copy()
+
+
+# Compiled once at import
+# All skip patterns in one alternation: a single regex call per line
+_SKIP_RE = re.compile("|".join(f"(?:{pattern})" for pattern in CiscoParser.SKIP_PATTERNS))
+# First characters of the anchored banner/end skip patterns
+_SKIP_FIRST_CHARS = frozenset("BCe")
+_SECTION_RE = re.compile(
+    r'^(interface|router|line|ip access-list|crypto|class-map|'
+    r'policy-map|route-map|vlan|spanning-tree|aaa|key chain)\s+(.*)',
+    re.IGNORECASE
+)
+# Characters a section keyword can start with under IGNORECASE: the
+# initials of the keywords in both cases, plus the non-ASCII letters that
+# case-fold to i, s and k
+_SECTION_STARTS = frozenset("irlcpvsakIRLCPVSAK\u0130\u0131\u017f\u212a")
@@ -3,17 +3,35 @@ Firewall Configuration Parser
 Parses iptables, nftables, and generic firewall rule configurations.
 """
 
+import io
 import re
+import sys
+from typing import Iterable
 from core.models import ParsedConfig
 
 
+# iptables-save lines
+_POLICY_RE = re.compile(r'^:(\w+)\s+(ACCEPT|DROP|REJECT)\s*')     # :INPUT ACCEPT [0:0]
+# -A INPUT -p tcp --dport 22 -j ACCEPT: the lookaheads pick out the first
+# --dport value and -j target in the body without consuming it
+_RULE_RE = re.compile(
+    r'^-A\s+(?P<chain>\w+)\s+'
+    r'(?=(?:.*?--dport\s+(?P<dport>\S+))?)'
+    r'(?=(?:.*?-j\s+(?P<target>\w+))?)'
+    r'(?P<body>.*)'
+)
+_PFLAG_RE = re.compile(r'^-P\s+(\w+)\s+(ACCEPT|DROP|REJECT)')    # -P INPUT DROP
+
+
 class FirewallParser:
     """Parser for firewall configurations (iptables, nftables, generic)."""
 
     def parse(self, content: str) -> ParsedConfig:
         """Parse firewall config into structured format."""
         config = ParsedConfig(vendor="firewall")
-        lines = content.split('\n')
+        # Lines are streamed rather than split into a list up front; each
+        # parser below makes a single pass
+        lines = io.StringIO(content)
 
         # Detect firewall type
         fw_type = self._detect_firewall_type(content)
@@ -40,7 +58,7 @@ class FirewallParser:
         else:
             return "generic"
 
-    def _parse_iptables(self, lines: list, config: ParsedConfig):
+    def _parse_iptables(self, lines: Iterable[str], config: ParsedConfig):
         """Parse iptables-save/restore format."""
         current_table = "filter"
         rule_count = 0
@@ -48,7 +66,7 @@ class FirewallParser:
         for line in lines:
             line = line.strip()
 
-            if not line or line.startswith('#'):
+            if not line or line[0] == '#':
                 continue
 
             # Table declaration: *filter, *nat, *mangle
@@ -59,7 +77,7 @@ class FirewallParser:
                 continue
 
             # Chain policy: :INPUT ACCEPT [0:0]
-            policy_match = re.match(r'^:(\w+)\s+(ACCEPT|DROP|REJECT)\s*', line)
+            policy_match = _POLICY_RE.match(line)
             if policy_match:
                 chain = policy_match.group(1)
                 policy = policy_match.group(2)
@@ -70,25 +88,22 @@ class FirewallParser:
                 continue
 
             # Rule: -A INPUT -p tcp --dport 22 -j ACCEPT
-            rule_match = re.match(r'^-A\s+(\w+)\s+(.*)', line)
+            rule_match = _RULE_RE.match(line)
             if rule_match:
-                chain = rule_match.group(1)
-                rule_body = rule_match.group(2)
+                chain, dport, target, rule_body = rule_match.group(
+                    "chain", "dport", "target", "body"
+                )
                 rule_count += 1
 
                 rule_key = f"rule_{chain.lower()}_{rule_count}"
                 config.flat_keys[rule_key] = rule_body
 
-                # Extract specific rule attributes
-                if '--dport' in rule_body:
-                    port_match = re.search(r'--dport\s+(\S+)', rule_body)
-                    if port_match:
-                        config.flat_keys[f"{rule_key}_dport"] = port_match.group(1)
+                # Specific rule attributes, captured by the same match
+                if dport is not None:
+                    config.flat_keys[f"{rule_key}_dport"] = dport
 
-                if '-j' in rule_body:
-                    target_match = re.search(r'-j\s+(\w+)', rule_body)
-                    if target_match:
-                        config.flat_keys[f"{rule_key}_target"] = target_match.group(1)
+                if target is not None:
+                    config.flat_keys[f"{rule_key}_target"] = target
 
                 continue
 
@@ -98,27 +113,28 @@ class FirewallParser:
                 continue
 
             # Policy flags: -P INPUT DROP
-            pflag_match = re.match(r'^-P\s+(\w+)\s+(ACCEPT|DROP|REJECT)', line)
+            pflag_match = _PFLAG_RE.match(line)
             if pflag_match:
                 chain = pflag_match.group(1)
                 policy = pflag_match.group(2)
                 config.flat_keys[f"default_policy_{chain.lower()}"] = policy
 
-    def _parse_nftables(self, lines: list, config: ParsedConfig):
+    def _parse_nftables(self, lines: Iterable[str], config: ParsedConfig):
         """Parse nftables configuration."""
+        # Full '::'-joined path of each open block, innermost last
         block_stack = []
 
         for line in lines:
             line = line.strip()
 
-            if not line or line.startswith('#'):
+            if not line or line[0] == '#':
                 continue
 
             # Block opening
             if line.endswith('{'):
                 block_name = line[:-1].strip()
-                block_stack.append(block_name)
-                full_block = '::'.join(block_stack)
+                full_block = f"{block_stack[-1]}::{block_name}" if block_stack else block_name
+                block_stack.append(full_block)
                 config.blocks.append(full_block)
                 config.sections[full_block] = {}
                 continue
@@ -132,21 +148,22 @@ class FirewallParser:
             # Directives inside blocks
             line_clean = line.rstrip(';').strip()
             if line_clean:
-                current_block = '::'.join(block_stack) if block_stack else "global"
+                current_block = block_stack[-1] if block_stack else "global"
                 parts = line_clean.split(None, 1)
-                key = parts[0]
+                # Statement names recur in every chain; share one string each
+                key = sys.intern(parts[0])
                 value = parts[1] if len(parts) > 1 else "true"
 
                 config.flat_keys[f"{current_block}::{key}"] = value
                 if current_block in config.sections:
                     config.sections[current_block][key] = value
 
-    def _parse_generic(self, lines: list, config: ParsedConfig):
+    def _parse_generic(self, lines: Iterable[str], config: ParsedConfig):
         """Parse generic firewall config as key-value pairs."""
         for line in lines:
             line = line.strip()
 
-            if not line or line.startswith('#') or line.startswith('//'):
+            if not line or line[0] == '#' or line[:2] == '//':
                 continue
 
             parts = line.split(None, 1)
@@ -13,10 +13,11 @@ class JunOSParser:
     def parse(self, content: str) -> ParsedConfig:
         """Parse JunOS config into structured format."""
         config = ParsedConfig(vendor="junos")
-        lines = content.split('\n')
+        # Stripped once here for both the format check and the parse pass
+        lines = [line.strip() for line in content.split('\n')]
 
         # Detect format: set-style vs hierarchical
-        set_count = sum(1 for l in lines if l.strip().startswith('set '))
+        set_count = sum(1 for l in lines if l.startswith('set '))
         brace_count = sum(1 for l in lines if '{' in l or '}' in l)
 
         if set_count > brace_count:
@@ -27,12 +28,10 @@ class JunOSParser:
         return config
 
     def _parse_set_style(self, lines: list, config: ParsedConfig):
-        """Parse JunOS 'set' command style configuration."""
+        """Parse JunOS 'set' command style configuration (stripped lines)."""
         for line in lines:
-            line = line.strip()
-
             # Skip comments and empty lines
-            if not line or line.startswith('#') or line.startswith('/*'):
+            if not line or line[0] == '#' or line[:2] == '/*':
                 continue
 
             # Remove 'set ' prefix
@@ -58,53 +57,57 @@ class JunOSParser:
 
             # Build section hierarchy
             section = parts[0]
-            if section not in config.sections:
-                config.sections[section] = {}
+            current = config.sections.get(section)
+            if current is None:
+                current = config.sections[section] = {}
                 config.blocks.append(section)
 
-            # Nested sections
-            current = config.sections[section]
+            # Nested sections; a later shorter path can leave a string
+            # where a sub-dict was, so the walk stops at the first non-dict
             for part in parts[1:-1]:
-                if part not in current:
-                    current[part] = {}
-                if isinstance(current[part], dict):
-                    current = current[part]
-                else:
+                node = current.setdefault(part, {})
+                if not isinstance(node, dict):
                     break
-            if isinstance(current, dict) and len(parts) >= 2:
-                current[parts[-2] if len(parts) > 2 else parts[-1]] = value
+                current = node
+            current[parts[-2] if len(parts) > 2 else parts[-1]] = value
 
     def _parse_hierarchical(self, lines: list, config: ParsedConfig):
-        """Parse JunOS hierarchical (curly-brace) style configuration."""
+        """Parse JunOS hierarchical (curly-brace) style configuration (stripped lines)."""
+        # Space-joined path of each open block, outermost first
         path_stack = []
-        current_dict = config.sections
+        # Per open block, the object its name resolved to and the dict its
+        # key-value lines go into; a block name that already holds a string
+        # value sends its lines to the enclosing block's dict
+        node_stack = [config.sections]
+        target_stack = [config.sections]
 
         for line in lines:
-            line = line.strip()
-
             # Skip comments and empty lines
-            if not line or line.startswith('#') or line.startswith('/*') or line.startswith('*/'):
+            if not line or line[0] == '#' or line[:2] in ('/*', '*/'):
                 continue
 
             # Opening brace — push section
             if line.endswith('{'):
                 section_name = line[:-1].strip()
-                path_stack.append(section_name)
+                path_stack.append(f"{path_stack[-1]} {section_name}" if path_stack else section_name)
 
                 # Navigate/create nested structure
-                current = config.sections
-                for segment in path_stack:
-                    if segment not in current:
-                        current[segment] = {}
-                    current = current[segment]
-
-                config.blocks.append(' '.join(path_stack))
+                parent = node_stack[-1]
+                if section_name not in parent:
+                    parent[section_name] = {}
+                node = parent[section_name]
+                node_stack.append(node)
+                target_stack.append(node if isinstance(node, dict) else target_stack[-1])
+
+                config.blocks.append(path_stack[-1])
                 continue
 
             # Closing brace — pop section
             if line == '}':
                 if path_stack:
                     path_stack.pop()
+                    node_stack.pop()
+                    target_stack.pop()
                 continue
 
             # Key-value pair within current section
@@ -122,15 +125,8 @@ class JunOSParser:
                 value = "true"
 
             # Store in flat_keys with full path
-            flat_key = ' '.join(path_stack + [key]) if path_stack else key
+            flat_key = f"{path_stack[-1]} {key}" if path_stack else key
             config.flat_keys[flat_key] = value
 
             # Store in hierarchical sections
-            current = config.sections
-            for segment in path_stack:
-                if segment not in current:
-                    current[segment] = {}
-                if isinstance(current[segment], dict):
-                    current = current[segment]
-            if isinstance(current, dict):
-                current[key] = value
+            target_stack[-1][key] = value
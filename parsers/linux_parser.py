@@ -4,65 +4,86 @@ Parses Linux config files: sshd_config, sysctl.conf, login.defs, etc.
 Key=Value and Key Value formats.
 """
 
+import io
 import re
 from core.models import ParsedConfig
 
 
+# sshd_config Match blocks
+_MATCH_RE = re.compile(r'^Match\s+(.*)', re.IGNORECASE)
+
+
 class LinuxParser:
     """Parser for Linux configuration files (sshd_config, sysctl, login.defs)."""
 
     def parse(self, content: str) -> ParsedConfig:
         """Parse Linux config into structured format."""
         config = ParsedConfig(vendor="linux")
-        lines = content.split('\n')
+        # Lines are streamed rather than split into a list up front
+        lines = io.StringIO(content)
 
         # Detect config type from content
         config_type = self._detect_config_type(content)
+        # Section for config_type, created on the first key-value line
+        type_section = None
 
         for line in lines:
             line = line.strip()
 
             # Skip empty lines and comments
-            if not line or line.startswith('#'):
+            if not line or line[0] == '#':
                 continue
 
             # Handle Match blocks in sshd_config
-            match_block = re.match(r'^Match\s+(.*)', line, re.IGNORECASE)
+            match_block = _MATCH_RE.match(line)
             if match_block:
                 block_name = f"Match {match_block.group(1)}"
                 config.blocks.append(block_name)
-                if block_name not in config.sections:
-                    config.sections[block_name] = {}
+                config.sections.setdefault(block_name, {})
                 continue
 
-            # Parse key-value: supports key=value, key value, key\tvalue
-            kv_match = re.match(r'^(\S+)\s*[=\s]\s*(.*)', line)
-            if kv_match:
-                key = kv_match.group(1).strip()
-                value = kv_match.group(2).strip()
+            # Parse key-value: supports key=value, key value, key\tvalue.
+            # The key is the first whitespace-delimited token; a lone token
+            # splits at its last '=' (e.g. net.ipv4.ip_forward=0)
+            parts = line.split(None, 1)
+            if len(parts) == 2:
+                key, value = parts
+                if value[0] == '=':
+                    value = value[1:]
+            else:
+                eq = line.rfind('=')
+                if eq < 1:
+                    continue
+                key, value = line[:eq], line[eq + 1:]
+
+            value = value.strip()
 
-                # Remove surrounding quotes
-                value = value.strip('"').strip("'")
+            # Remove surrounding quotes
+            value = value.strip('"').strip("'")
 
-                # Remove inline comments
-                if ' #' in value:
-                    value = value[:value.index(' #')].strip()
+            # Remove inline comments
+            if ' #' in value:
+                value = value[:value.index(' #')].strip()
 
-                config.flat_keys[key] = value
+            config.flat_keys[key] = value
 
-                # Store in sections by config type
-                if config_type not in config.sections:
-                    config.sections[config_type] = {}
-                config.sections[config_type][key] = value
+            # Store in sections by config type
+            if type_section is None:
+                type_section = config.sections.setdefault(config_type, {})
+            type_section[key] = value
 
         config.blocks.append(config_type)
         return config
 
     def _detect_config_type(self, content: str) -> str:
         """Detect which Linux config file type this is."""
+        # Substring tests stay: each is a fast C scan that stops at the
+        # first hit, where a case-insensitive regex alternation walks the
+        # text character by character. 'sshd' usually sits in the header
+        # comment, so it is tried before 'permitrootlogin'.
         content_lower = content.lower()
 
-        if 'permitrootlogin' in content_lower or 'sshd' in content_lower:
+        if 'sshd' in content_lower or 'permitrootlogin' in content_lower:
             return "sshd_config"
         elif 'net.ipv4' in content_lower or 'sysctl' in content_lower:
             return "sysctl"
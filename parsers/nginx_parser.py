@@ -3,60 +3,72 @@ Nginx Configuration Parser
 Parses Nginx configuration files with block-style directives.
 """
 
+import io
 import re
 from core.models import ParsedConfig
 
 
+# Block openers ("http {", "location /path {") and one-line blocks
+# ("events { worker_connections 512; }"); both need a '{' on the line
+_BRACE_OPEN_RE = re.compile(r'^(\S+(?:\s+\S+)*)\s*\{')
+_INLINE_RE = re.compile(r'^(\S+)\s*\{(.*)\}')
+
+
 class NginxParser:
     """Parser for Nginx configuration files."""
 
     def parse(self, content: str) -> ParsedConfig:
         """Parse Nginx config into structured format."""
         config = ParsedConfig(vendor="nginx")
-        lines = content.split('\n')
+        # Lines are streamed rather than split into a list up front
+        lines = io.StringIO(content)
 
-        block_stack = []        # Track nested block context
+        block_stack = []        # '::'-joined path of each open block
         current_block_name = "global"
+        # sections entry for current_block_name, looked up on first use
+        current_section = None
 
         for line in lines:
             line = line.strip()
 
             # Skip comments and empty lines
-            if not line or line.startswith('#'):
+            if not line or line[0] == '#':
                 continue
 
+            # Plain directives (the bulk of the file) skip the block regexes
+            has_brace = '{' in line
+
             # Handle opening block: "http {", "server {", "location /path {"
-            brace_open = re.match(r'^(\S+(?:\s+\S+)*)\s*\{', line)
+            brace_open = _BRACE_OPEN_RE.match(line) if has_brace else None
             if brace_open:
                 block_name = brace_open.group(1).strip()
+                if block_stack:
+                    block_name = f"{block_stack[-1]}::{block_name}"
                 block_stack.append(block_name)
-                current_block_name = '::'.join(block_stack)
+                current_block_name = block_name
                 config.blocks.append(current_block_name)
-
-                if current_block_name not in config.sections:
-                    config.sections[current_block_name] = {}
+                current_section = config.sections.setdefault(current_block_name, {})
                 continue
 
             # Handle closing block
             if line == '}' or line == '};':
                 if block_stack:
                     block_stack.pop()
-                current_block_name = '::'.join(block_stack) if block_stack else "global"
+                current_block_name = block_stack[-1] if block_stack else "global"
+                current_section = None
                 continue
 
             # Handle inline block: "events { worker_connections 512; }"
-            inline_match = re.match(r'^(\S+)\s*\{(.*)\}', line)
+            inline_match = _INLINE_RE.match(line) if has_brace else None
             if inline_match:
                 block_name = inline_match.group(1)
                 inner = inline_match.group(2).strip().rstrip(';')
-                full_block = '::'.join(block_stack + [block_name])
+                full_block = f"{block_stack[-1]}::{block_name}" if block_stack else block_name
                 config.blocks.append(full_block)
                 if inner:
                     key, _, value = inner.partition(' ')
                     config.flat_keys[f"{full_block}::{key}"] = value.strip()
-                    if full_block not in config.sections:
-                        config.sections[full_block] = {}
-                    config.sections[full_block][key] = value.strip()
+                    config.sections.setdefault(full_block, {})[key] = value.strip()
                 continue
 
             # Parse directive: key value;
@@ -77,8 +89,8 @@ class NginxParser:
             config.flat_keys[flat_key] = value
 
             # Store in sections dict
-            if current_block_name not in config.sections:
-                config.sections[current_block_name] = {}
-            config.sections[current_block_name][key] = value
+            if current_section is None:
+                current_section = config.sections.setdefault(current_block_name, {})
+            current_section[key] = value
 
         return config
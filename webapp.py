@@ -8,7 +8,10 @@ Open: http://localhost:5000
 import os
 import sys
 import json
-import tempfile
+import threading
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from flask import Flask, request, jsonify, send_from_directory
 
 # Add project root to path
@@ -23,9 +26,92 @@ from core.severity_classifier import SeverityClassifier
 from core.score_calculator import ScoreCalculator
 from core.rule_repo_manager import RuleRepoManager
 
+try:
+    import orjson  # pyre-ignore
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 app = Flask(__name__, static_folder='static')
 app.config['MAX_CONTENT_LENGTH'] = 10 * 1024 * 1024  # 10MB max upload
 
+# Pipeline components shared by all requests
+_HANDLER = InputHandler()
+_DETECTOR = VendorDetector()
+_PARSER = ParserEngine()
+_NORMALIZER = Normalizer()
+_ENGINE = RuleEngine()
+_CLASSIFIER = SeverityClassifier()
+_CALC = ScoreCalculator()
+# RuleEngine keeps a per-instance result cache; serialize access to it
+_ENGINE_LOCK = threading.Lock()
+
+# Worker processes that run the pipeline for /api/evaluate, so concurrent
+# uploads are evaluated in parallel instead of contending for the GIL; each
+# worker keeps its own rule repository and result caches. Created on first use.
+_POOL = None
+_POOL_LOCK = threading.Lock()
+
+# (rules_dir, newest mtime) -> loaded RuleRepoManager; one live entry
+_REPO_CACHE = {}
+
+# (hash_algo, file_hash, filename, standards) -> response dict, least
+# recently used first; evaluation is deterministic for a given rule set,
+# so the cache is cleared whenever the rules are reloaded
+RESULT_CACHE_SIZE = 256
+_RESULT_CACHE = OrderedDict()
+_RESULT_LOCK = threading.Lock()
+
+
+def _rules_mtime(rules_dir):
+    """Newest modification time of the rules tree (files and directories)."""
+    return max(
+        (os.path.getmtime(os.path.join(root, name))
+         for root, dirs, files in os.walk(rules_dir)
+         for name in [*dirs, *files, '.']),
+        default=0.0,
+    )
+
+
+def _get_repo(rules_dir):
+    """Return the loaded rule repository, reloading only when rules change."""
+    key = (rules_dir, _rules_mtime(rules_dir))
+    repo = _REPO_CACHE.get(key)
+    if repo is None:
+        repo = RuleRepoManager(rules_dir)
+        repo.load_all()
+        _REPO_CACHE.clear()
+        _REPO_CACHE[key] = repo
+        with _RESULT_LOCK:
+            _RESULT_CACHE.clear()
+    return repo
+
+
+def _get_pool():
+    """Return the evaluation process pool, starting it on first use."""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            # Spawned, not forked: the pool starts from a request thread of
+            # the threaded server, and a fork could copy a held lock
+            _POOL = ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+    return _POOL
+
+
+def _json_response(data):
+    """
+    JSON response for API payloads, serialized with orjson when available.
+
+    Keys are sorted to match Flask's default jsonify output.
+    """
+    if ORJSON_AVAILABLE:
+        body = orjson.dumps(data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        return app.response_class(body, mimetype='application/json')
+    return jsonify(data)
+
 
 @app.route('/')
 def index():
@@ -37,10 +123,9 @@ def index():
 def get_standards():
     """Return available standards."""
     rules_dir = os.path.join(os.path.dirname(__file__), 'rules')
-    repo = RuleRepoManager(rules_dir)
-    rules = repo.load_all()
+    rules = _get_repo(rules_dir).get_all()
     standards = sorted(set(r.standard for r in rules))
-    return jsonify({"standards": standards})
+    return _json_response({"standards": standards})
 
 
 @app.route('/api/evaluate', methods=['POST'])
@@ -59,74 +144,91 @@ def evaluate():
         standards_str = request.form.get('standards', '')
         standards = [s.strip() for s in standards_str.split(',') if s.strip()] or None
 
-        # Save uploaded file temporarily
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.conf', delete=False, encoding='utf-8') as tmp:
-            content = file.read().decode('utf-8', errors='replace')
-            tmp.write(content)
-            tmp_path = tmp.name
-
-        try:
-            # Run the SmartISMS pipeline
-            result = run_pipeline(tmp_path, file.filename, standards)
-            return jsonify(result)
-        finally:
-            # Cleanup temp file
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
+        # Raw upload bytes go straight to the worker; InputHandler decodes
+        # them there, with no temp file in between
+        data = file.read()
+
+        # Run the SmartISMS pipeline in a worker process
+        future = _get_pool().submit(run_pipeline, data, file.filename, standards)
+        result = future.result()
+        return _json_response(result)
 
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 
-def run_pipeline(file_path, original_filename, standards=None):
-    """Run the full SmartISMS evaluation pipeline and return JSON results."""
+def run_pipeline(data, original_filename, standards=None):
+    """Run the full SmartISMS evaluation pipeline on uploaded bytes and return JSON results."""
+
+    # Step 1: Load content (original filename is used for detection)
+    config_input = _HANDLER.load_bytes(data, original_filename)
 
-    # Step 1: Load file
-    handler = InputHandler()
-    config_input = handler.load_file(file_path)
-    config_input.filename = original_filename  # Use original filename for detection
+    rules_dir = os.path.join(os.path.dirname(__file__), 'rules')
+    repo = _get_repo(rules_dir)
+
+    # Repeat uploads of the same file reuse the earlier result
+    cache_key = (
+        config_input.hash_algo,
+        config_input.file_hash,
+        original_filename,
+        tuple(sorted(standards or ())),
+    )
+    with _RESULT_LOCK:
+        result = _RESULT_CACHE.get(cache_key)
+        if result is not None:
+            _RESULT_CACHE.move_to_end(cache_key)
+            return result
+
+    result = _evaluate(config_input, original_filename, standards, repo)
+    with _RESULT_LOCK:
+        _RESULT_CACHE[cache_key] = result
+        if len(_RESULT_CACHE) > RESULT_CACHE_SIZE:
+            _RESULT_CACHE.popitem(last=False)
+    return result
+
+
+def _evaluate(config_input, original_filename, standards, repo):
+    """Run steps 2-7 of the pipeline on a loaded config."""
 
     # Step 2: Detect vendor
-    detector = VendorDetector()
-    vendor_info = detector.detect(config_input)
+    vendor_info = _DETECTOR.detect(config_input)
 
     # Step 3: Parse
-    parser = ParserEngine()
-    parsed = parser.parse(config_input, vendor_info)
+    parsed = _PARSER.parse(config_input, vendor_info)
 
     # Step 4: Normalize
-    normalizer = Normalizer()
-    normalized = normalizer.normalize(parsed)
+    normalized = _NORMALIZER.normalize(parsed)
 
-    # Step 5: Load rules and evaluate
-    rules_dir = os.path.join(os.path.dirname(__file__), 'rules')
-    repo = RuleRepoManager(rules_dir)
-    all_rules = repo.load_all()
+    # Step 5: Evaluate
+    all_rules = repo.get_all()
 
-    engine = RuleEngine()
-    rule_results = engine.evaluate(normalized, all_rules, standards)
+    with _ENGINE_LOCK:
+        rule_results = _ENGINE.evaluate(normalized, all_rules, standards, repo=repo)
 
     # Step 6: Classify and score
-    classifier = SeverityClassifier()
-    classified = classifier.classify(rule_results)
+    batch = _CLASSIFIER.classify_batch(rule_results)
+    classified = batch.results
 
-    calculator = ScoreCalculator()
-    score = calculator.calculate(classified)
+    score = _CALC.calculate(batch)
 
     # Step 7: Build response
+    # The result and rule are fetched once per entry rather than per field
     rules_detail = []
+    append = rules_detail.append
     for cr in classified:
-        rules_detail.append({
-            "rule_id": cr.rule_result.rule.rule_id,
-            "title": cr.rule_result.rule.title,
-            "standard": cr.rule_result.rule.standard,
-            "category": cr.rule_result.rule.category,
+        rr = cr.rule_result
+        rule = rr.rule
+        append({
+            "rule_id": rule.rule_id,
+            "title": rule.title,
+            "standard": rule.standard,
+            "category": rule.category,
             "severity": cr.severity_label,
             "status": cr.status_label,
-            "expected": cr.rule_result.expected_value,
-            "found": cr.rule_result.found_value,
-            "reason": cr.rule_result.reason,
-            "weight": cr.rule_result.rule.weight,
+            "expected": rr.expected_value,
+            "found": rr.found_value,
+            "reason": rr.reason,
+            "weight": rule.weight,
         })
 
     # Per-standard breakdown
@@ -145,7 +247,7 @@ def run_pipeline(file_path, original_filename, standards=None):
     return {
         "filename": original_filename,
         "file_size": config_input.file_size,
-        "file_hash": config_input.file_hash[:16] + "...",
+        "file_hash": config_input.file_hash_hex[:16] + "...",
         "vendor": vendor_info.vendor_name.upper(),
         "vendor_confidence": vendor_info.confidence,
         "total_rules_evaluated": len(classified),